@@ -1,8 +1,8 @@
 import re
 import os
-import yaml
 import jinja2
 import logging
+import functools
 from typing import Optional, Union
 from pathlib import Path
 
@@ -11,15 +11,14 @@ from jobsherpa.agent.workspace_manager import WorkspaceManager
 from jobsherpa.agent.tool_executor import ToolExecutor
 from jobsherpa.config import UserConfig
 from jobsherpa.agent.types import ActionResult
-from jobsherpa.agent.recipe_index import SimpleKeywordIndex
+from jobsherpa.agent.recipe_index import SimpleKeywordIndex, shared_keyword_index
 from jobsherpa.kb.models import SystemProfile, ApplicationRecipe
 from jobsherpa.kb.dataset_index import DatasetIndex
 from jobsherpa.kb.module_client import ModuleClient
 from jobsherpa.kb.system_index import SystemIndex
 from jobsherpa.kb.app_registry import AppRegistry
 from jobsherpa.kb.site_loader import load_site_profile
-from jobsherpa.util.io import read_yaml
-from jobsherpa.kb.service import KnowledgeBaseService
+from jobsherpa.kb.service import get_kb_service
 from jobsherpa.util.errors import ExceptionManager
 from jobsherpa.kb.scheduler_loader import load_scheduler_profile
 
@@ -76,6 +75,71 @@ class _ParamRegistry:
             lines.append(f"{k.ljust(col1)}  {v.ljust(col2)}  {o.ljust(col3)}")
         return "\n".join(lines)
 
+@functools.lru_cache(maxsize=64)
+def _required_params(site_requirements: tuple[str, ...], system_requirements: tuple[str, ...]) -> tuple[str, ...]:
+    """Ordered, de-duplicated parameters a templated job must have; job_name is always required."""
+    return tuple(dict.fromkeys(site_requirements + system_requirements + ("job_name",)))
+
+def _track_template_param(name: str, value):
+    logger.debug("Setting template param %-20s = %s", name, value)
+    return value
+
+class _LazyBytecodeCache(jinja2.FileSystemBytecodeCache):
+    """
+    On-disk cache of compiled template bytecode whose directory is only
+    created when a template is first compiled; if it cannot be, templates
+    are simply not cached.
+    """
+    def __init__(self, directory: str) -> None:
+        super().__init__(directory=directory)
+        self._usable: Optional[bool] = None
+
+    def dump_bytecode(self, bucket) -> None:
+        if self._usable is None:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                self._usable = True
+            except OSError as e:
+                logger.debug("Jinja bytecode cache disabled (%s): %s", self.directory, e)
+                self._usable = False
+        if self._usable:
+            super().dump_bytecode(bucket)
+
+def _jinja_bytecode_cache() -> jinja2.BytecodeCache:
+    cache_root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return _LazyBytecodeCache(os.path.join(cache_root, "jobsherpa", "jinja"))
+
+@functools.lru_cache(maxsize=8)
+def _get_jinja_env(tools_dir: str) -> jinja2.Environment:
+    """Shared Jinja environment for an absolute templates directory.
+
+    Jinja's default auto_reload stays on: each lookup costs one stat of the
+    template, and edited templates are recompiled instead of served stale.
+    """
+    env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(tools_dir),
+        cache_size=200,
+        bytecode_cache=_jinja_bytecode_cache(),
+    )
+    # Add a simple debug function to trace substitutions if used in templates
+    env.globals['dbg'] = _track_template_param
+    return env
+
+# Slurm prints this prefix verbatim, so a plain find() locates the job id and
+# the precompiled pattern only has to match at that offset
+_SUBMITTED_PREFIX = "Submitted batch job "
+_JOB_ID_RE = re.compile(r"Submitted batch job (\S+)")
+
+def parse_job_id(output: str) -> Optional[str]:
+    """Parses a job ID from sbatch output by locating the literal prefix."""
+    start = output.find(_SUBMITTED_PREFIX)
+    while start >= 0:
+        match = _JOB_ID_RE.match(output, start)
+        if match:
+            return match.group(1)
+        start = output.find(_SUBMITTED_PREFIX, start + len(_SUBMITTED_PREFIX))
+    return None
+
 class RunJobAction:
     def __init__(
         self, 
@@ -92,16 +156,9 @@ class RunJobAction:
         self.knowledge_base_dir = knowledge_base_dir
         self.user_config = user_config
         self.system_config = system_config
-        # Replace bespoke RAG plumbing with a RecipeIndex abstraction
-        self.recipe_index = SimpleKeywordIndex(knowledge_base_dir)
-        self.recipe_index.index()
-        self.dataset_index = DatasetIndex(base_dir=knowledge_base_dir)
-        self.dataset_index.index()
-        self.system_index = SystemIndex(base_dir=knowledge_base_dir)
-        self.system_index.index()
-        # App registry stored under workspace/.jobsherpa/apps.json
-        history_dir = os.path.dirname(job_history.history_file_path) if getattr(job_history, 'history_file_path', None) else os.path.join(os.getcwd(), ".jobsherpa")
-        self.app_registry = AppRegistry(registry_path=os.path.join(history_dir, "apps.json"))
+        # The recipe, dataset and system indexes and the app registry are built
+        # on first use (see the properties below), so sessions that only query
+        # job history never scan or parse the knowledge base.
         # Normalize system profile to Pydantic model if possible
         self.system_profile_model: Optional[SystemProfile] = None
         if isinstance(system_config, dict):
@@ -114,6 +171,35 @@ class RunJobAction:
                     self.system_profile_model = None
         # Private cache of scheduler command mappings; do not expose in system_config/template context
         self._scheduler_commands: dict[str, str] = {}
+        # Jinja environment shared per tools directory so compiled templates are
+        # reused across prompts and agents running from the same directory
+        self._jinja_env = _get_jinja_env(os.path.abspath("tools"))
+
+    @functools.cached_property
+    def recipe_index(self) -> SimpleKeywordIndex:
+        """
+        Recipe lookup, created on first use and shared by every action over the
+        same knowledge base; recipes are indexed on the first find_best() call.
+        """
+        return shared_keyword_index(self.knowledge_base_dir)
+
+    @functools.cached_property
+    def dataset_index(self) -> DatasetIndex:
+        dataset_index = DatasetIndex(base_dir=self.knowledge_base_dir)
+        dataset_index.index()
+        return dataset_index
+
+    @functools.cached_property
+    def system_index(self) -> SystemIndex:
+        system_index = SystemIndex(base_dir=self.knowledge_base_dir)
+        system_index.index()
+        return system_index
+
+    @functools.cached_property
+    def app_registry(self) -> AppRegistry:
+        # App registry stored under workspace/.jobsherpa/apps.json
+        history_dir = os.path.dirname(self.job_history.history_file_path) if getattr(self.job_history, 'history_file_path', None) else os.path.join(os.getcwd(), ".jobsherpa")
+        return AppRegistry(registry_path=os.path.join(history_dir, "apps.json"))
 
     def _resolve_command(self, generic_command: str) -> str:
         """
@@ -153,7 +239,7 @@ class RunJobAction:
         # First, try to update the agent's configuration from the conversational context
         provenance = _ParamRegistry()
         kb_load_notes: list[str] = []
-        kb_service = KnowledgeBaseService(base_dir=self.knowledge_base_dir)
+        kb_service = get_kb_service(self.knowledge_base_dir)
         if context:
             if 'workspace' in context and not self.user_config.defaults.workspace:
                 # Normalize and validate workspace: expand env vars and ~, ensure exists & writable
@@ -474,14 +560,11 @@ class RunJobAction:
                     )
 
             # --- 2. Validate Final Context ---
-            missing_or_empty_params = []
             # We now require job_name as a standard parameter
-            site_requirements = site_profile.job_requirements if site_profile else []
-            system_requirements = self.system_config.get("job_requirements", [])
-            required_params = list(dict.fromkeys(site_requirements + system_requirements + ["job_name"]))
-            for param in required_params:
-                if param not in template_context or not template_context.get(param):
-                    missing_or_empty_params.append(param)
+            site_requirements = tuple(site_profile.job_requirements or ()) if site_profile else ()
+            system_requirements = tuple(self.system_config.get("job_requirements") or ())
+            required_params = _required_params(site_requirements, system_requirements)
+            missing_or_empty_params = [param for param in required_params if not template_context.get(param)]
             
             if missing_or_empty_params:
                 # Ask for the first missing or empty parameter
@@ -509,20 +592,19 @@ class RunJobAction:
             template_context["job_dir"] = str(job_workspace.job_dir)
 
             try:
-                def _track(name: str, value):
-                    logger.debug("Setting template param %-20s = %s", name, value)
-                    return value
-
-                env = jinja2.Environment(loader=jinja2.FileSystemLoader("tools"))
-                # Add a simple debug function to trace substitutions if used in templates
-                env.globals['dbg'] = _track
-                template = env.get_template(recipe["template"])
-                rendered_script = template.render(template_context)
-                logger.debug("Rendered script content:\n%s", rendered_script)
-
-                # Write the rendered script to a file in the isolated job directory
-                with open(job_workspace.script_path, 'w') as f:
-                    f.write(rendered_script)
+                template = self._jinja_env.get_template(recipe["template"])
+                # Write the rendered script to a file in the isolated job directory.
+                # Stream it straight into the file unless the full text is
+                # needed for the debug log.
+                if logger.isEnabledFor(logging.DEBUG):
+                    rendered_script = template.render(template_context)
+                    logger.debug("Rendered script content:\n%s", rendered_script)
+                    with open(job_workspace.script_path, 'w') as f:
+                        f.write(rendered_script)
+                else:
+                    stream = template.stream(template_context)
+                    with open(job_workspace.script_path, 'w') as f:
+                        stream.dump(f)
                 logger.info("Wrote rendered script to: %s", job_workspace.script_path)
 
                 # The "tool" in a templated recipe is a generic command (e.g., 'submit'); resolve via scheduler KB
@@ -561,6 +643,8 @@ class RunJobAction:
 
             # If a parser exists, its 'file' field might be a template. Render it.
             if output_parser and 'file' in output_parser:
+                # Recipes are shared across prompts via the recipe index; never mutate them in place
+                output_parser = dict(output_parser)
                 try:
                     # Create a mini-template from the file string and render it with the same context
                     file_template = jinja2.Template(output_parser['file'])
@@ -596,33 +680,30 @@ class RunJobAction:
         
         return ActionResult(message=response, is_waiting=False)
 
-    # Legacy RAG helpers removed in favor of RecipeIndex
+    _parse_job_id = staticmethod(parse_job_id)
 
-    def _parse_job_id(self, output: str) -> Optional[str]:
-        """Parses a job ID from a string using regex."""
-        match = re.search(r"Submitted batch job (\S+)", output)
-        if match:
-            return match.group(1)
-        return None
+# Only the job-id branch needs a regex; the "last status"/"last result"
+# checks are plain substring tests.
+_JOB_BY_ID_RE = re.compile(r"job\s+(\d+)")
 
 class QueryHistoryAction:
     def __init__(self, job_history: JobHistory):
         self.job_history = job_history
 
     def run(self, prompt: str) -> str:
-        # Simple dispatcher based on flexible regex matching
+        # Simple dispatcher based on keyword and job-id matching
         prompt_lower = prompt.lower()
         logger.debug("QueryHistoryAction received prompt: %s", prompt)
-        if re.search(r"(?=.*status)(?=.*last)", prompt_lower):
-            logger.debug("Matched last status query")
-            return self._get_last_job_status()
-        elif re.search(r"(?=.*result)(?=.*last)", prompt_lower):
-            logger.debug("Matched last result query")
-            return self._get_last_job_result()
-        
-        job_id_match = re.search(r"job\s+(\d+)", prompt_lower)
-        if job_id_match:
-            job_id = job_id_match.group(1)
+        if "last" in prompt_lower:
+            if "status" in prompt_lower:
+                logger.debug("Matched last status query")
+                return self._get_last_job_status()
+            if "result" in prompt_lower:
+                logger.debug("Matched last result query")
+                return self._get_last_job_result()
+        match = _JOB_BY_ID_RE.search(prompt_lower)
+        if match:
+            job_id = match.group(1)
             logger.debug("Matched job by id query for job_id=%s", job_id)
             return self._get_job_by_id_summary(job_id)
 
@@ -688,15 +769,12 @@ class QueryHistoryAction:
         Returns:
             A string containing the job summary, or a message if the job is not found.
         """
-        job_info = self.job_history.get_job_by_id(job_id)
-        logger.debug("Lookup job by id %s -> found: %s", job_id, bool(job_info))
-        if not job_info:
+        summary = self.job_history.get_full_summary(job_id)
+        logger.debug("Lookup job by id %s -> found: %s", job_id, bool(summary))
+        if not summary:
             return f"Sorry, I couldn't find any information for job ID {job_id}."
-            
-        status = self.job_history.check_job_status(job_id)
-        result = job_info.get('result')
-        if result is None:
-            logger.debug("Result missing for job %s; trying direct parse from output file", job_id)
-            result = self.job_history.try_parse_result(job_id) or 'Not available'
+
+        status = summary["status"]
+        result = summary["result"] or 'Not available'
         logger.info("Job %s summary: status=%s, result=%s", job_id, status, result)
         return f"Job {job_id} status is {status}. Result: {result}"
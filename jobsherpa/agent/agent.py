@@ -1,9 +1,6 @@
-import yaml
 import os
-import re
-import jinja2
 import logging
-import uuid
+import functools
 from typing import Optional
 from jobsherpa.agent.tool_executor import ToolExecutor
 from jobsherpa.agent.job_history import JobHistory
@@ -13,11 +10,22 @@ from jobsherpa.agent.conversation_manager import ConversationManager
 from jobsherpa.agent.actions import RunJobAction, QueryHistoryAction
 from jobsherpa.agent.config_manager import ConfigManager
 from jobsherpa.config import UserConfig
-from jobsherpa.util.io import read_yaml
-from jobsherpa.kb.service import KnowledgeBaseService
+from jobsherpa.util.io import read_yaml_cached
+from jobsherpa.kb.service import get_kb_service
 
 logger = logging.getLogger(__name__)
 
+# History directories already created in this process; skips repeat makedirs walks.
+# JobHistory recreates its directory if it is removed after that.
+_KNOWN_DIRS: set[str] = set()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_intent_classifier() -> IntentClassifier:
+    """The classifier holds no per-turn state, so one instance serves every agent."""
+    return IntentClassifier()
+
+
 class JobSherpaAgent:
     """
     The core logic of the JobSherpa AI agent.
@@ -48,6 +56,7 @@ class JobSherpaAgent:
                 profile_path = None # No path, so don't offer to save later
             else:
                 # Attempt to load; if invalid or missing required fields, fall back gracefully but salvage known defaults
+                user_config_manager = None
                 try:
                     user_config_manager = ConfigManager(config_path=profile_path)
                     user_config = user_config_manager.load()
@@ -55,11 +64,13 @@ class JobSherpaAgent:
                     from jobsherpa.config import UserConfig, UserConfigDefaults
                     logger.warning("Failed to load user profile at %s (%s). Attempting lenient load.", profile_path, e)
                     # Lenient loader: keep known defaults, warn on unknown keys, prompt later for missing requireds
-                    try:
-                        with open(profile_path, "r") as f:
-                            raw = yaml.safe_load(f) or {}
-                    except Exception:
-                        raw = {}
+                    # Reuse the parse from the failed load() when there is one
+                    raw = user_config_manager.raw_data if user_config_manager is not None else None
+                    if raw is None:
+                        try:
+                            raw = read_yaml_cached(profile_path)
+                        except Exception:
+                            raw = {}
                     defaults_raw = raw.get("defaults", {}) if isinstance(raw, dict) else {}
                     known_keys = {"workspace", "system", "partition", "allocation"}
                     unknown_keys = [k for k in defaults_raw.keys() if k not in known_keys]
@@ -90,11 +101,13 @@ class JobSherpaAgent:
             expanded_ws = user_config.defaults.workspace or ""
         self.workspace = expanded_ws
         history_dir = os.path.join(self.workspace, ".jobsherpa") if self.workspace else os.path.join(os.getcwd(), ".jobsherpa")
-        os.makedirs(history_dir, exist_ok=True)
+        if history_dir not in _KNOWN_DIRS:
+            os.makedirs(history_dir, exist_ok=True)
+            _KNOWN_DIRS.add(history_dir)
         history_file = os.path.join(history_dir, "history.json")
         
         effective_system_profile = system_profile or user_config.defaults.system
-        kb_service = KnowledgeBaseService(base_dir=knowledge_base_dir)
+        kb_service = get_kb_service(knowledge_base_dir)
         
         system_config = None
         if effective_system_profile:
@@ -104,7 +117,7 @@ class JobSherpaAgent:
         tool_executor = ToolExecutor(dry_run=dry_run)
         job_history = JobHistory(history_file_path=history_file)
         workspace_manager = WorkspaceManager(base_path=self.workspace)
-        intent_classifier = IntentClassifier()
+        intent_classifier = _get_intent_classifier()
         
         # --- 3. Initialize Action Handlers (passing the typed config object) ---
         run_job_action = RunJobAction(
@@ -135,7 +148,3 @@ class JobSherpaAgent:
         """
         response, job_id, is_waiting = self.conversation_manager.handle_prompt(prompt)
         return response, job_id, is_waiting
-
-    # Deprecated helper methods and dead code below will be removed as part of refactor
-
-    
@@ -1,37 +1,77 @@
 from ruamel.yaml import YAML
 from jobsherpa.config import UserConfig
+from typing import Any, Dict, Optional, Tuple
+import copy
 import os
 
+# config path -> ((mtime_ns, size), raw data, validated UserConfig); lets
+# repeated load() calls on an unchanged file skip parsing and validation.
+_LOAD_CACHE: Dict[str, Tuple[Tuple[int, int], dict, UserConfig]] = {}
+# config path -> ((mtime_ns, size), round-trip document) as written by the
+# last save(), so back-to-back saves skip re-parsing the file with ruamel.
+_SAVE_DOC_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def _stat_key(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
 class ConfigManager:
     """
     Manages loading, validating, and saving user configuration files
     while preserving comments and formatting.
     """
+    __slots__ = ("config_path", "yaml", "raw_data")
+
     def __init__(self, config_path: str):
         self.config_path = config_path
         self.yaml = YAML()
         self.yaml.preserve_quotes = True
+        # The parsed file from the last load(), kept even when validation fails
+        # so callers can salvage known values without parsing the file again.
+        self.raw_data: Optional[dict] = None
 
     def load(self) -> UserConfig:
         """
         Loads the YAML file, validates it with Pydantic, and returns a
         UserConfig object.
         """
-        with open(self.config_path, 'r') as f:
-            data = self.yaml.load(f)
+        key = _stat_key(self.config_path)
+        cached = _LOAD_CACHE.get(self.config_path)
+        if key is not None and cached is not None and cached[0] == key:
+            self.raw_data = copy.deepcopy(cached[1])
+            return copy.deepcopy(cached[2])
+
+        # Validation only needs plain data, so use ruamel's safe loader; it
+        # follows the same YAML 1.2 rules as the round-trip dumper in save()
+        # (e.g. "on"/"no" stay strings), which is reserved for writing.
+        with open(self.config_path, 'rb') as f:
+            data = YAML(typ='safe').load(f)
+        self.raw_data = data
         # Pydantic v1 vs v2 compatibility
         try:
-            return UserConfig.model_validate(data)  # v2
+            config = UserConfig.model_validate(data)  # v2
         except AttributeError:
-            return UserConfig.parse_obj(data)  # v1
+            config = UserConfig.parse_obj(data)  # v1
+        if key is not None:
+            _LOAD_CACHE[self.config_path] = (key, copy.deepcopy(data), copy.deepcopy(config))
+        return config
 
     def save(self, config: UserConfig):
         """
         Saves a UserConfig object back to the YAML file, preserving comments.
         """
         raw_data = {}
-        # If the file exists, load it to preserve comments and structure.
-        if os.path.exists(self.config_path):
+        key = _stat_key(self.config_path)
+        cached = _SAVE_DOC_CACHE.pop(self.config_path, None)
+        if key is not None and cached is not None and cached[0] == key:
+            # The file is exactly what we last wrote; reuse that document.
+            raw_data = cached[1]
+        elif os.path.exists(self.config_path):
+            # Load the file to preserve comments and structure.
             with open(self.config_path, 'r') as f:
                 raw_data = self.yaml.load(f) or {}
         
@@ -50,3 +90,7 @@ class ConfigManager:
 
         with open(self.config_path, 'w') as f:
             self.yaml.dump(raw_data, f)
+        _LOAD_CACHE.pop(self.config_path, None)
+        key = _stat_key(self.config_path)
+        if key is not None:
+            _SAVE_DOC_CACHE[self.config_path] = (key, raw_data)
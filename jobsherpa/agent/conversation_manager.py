@@ -2,16 +2,37 @@ from jobsherpa.agent.intent_classifier import IntentClassifier
 from jobsherpa.agent.actions import RunJobAction, QueryHistoryAction
 from jobsherpa.agent.config_manager import ConfigManager
 from jobsherpa.agent.types import ActionResult
+from jobsherpa.config import UserConfig, UserConfigDefaults
 from typing import Optional
 import logging
+import os
+import re
 
 logger = logging.getLogger(__name__)
 
+# Keys in a save selection reply, separated by commas and/or whitespace.
+_SAVE_KEY_RE = re.compile(r"[^,\s]+")
+
 class ConversationManager:
     """
     Orchestrates the conversation flow, determining user intent and delegating
     to the appropriate action handlers. Manages conversational context.
     """
+    __slots__ = (
+        "intent_classifier",
+        "run_job_action",
+        "query_history_action",
+        "user_profile_path",
+        "_is_waiting",
+        "_pending_action",
+        "_pending_prompt",
+        "_context",
+        "_param_needed",
+        "_is_waiting_for_save_confirmation",
+        "action_handlers",
+        "_config_manager",
+    )
+
     def __init__(self, intent_classifier, run_job_action, query_history_action, user_profile_path: Optional[str] = None):
         self.intent_classifier = intent_classifier
         self.run_job_action = run_job_action
@@ -25,6 +46,15 @@ class ConversationManager:
         self._context = {}
         self._param_needed = None
         self._is_waiting_for_save_confirmation = False
+        # Created on the first profile save and reused after; its loads are
+        # served from ConfigManager's mtime-keyed cache while the file is unchanged.
+        self._config_manager: Optional[ConfigManager] = None
+
+        # Intent -> handler for a new conversation; unknown intents run a job.
+        self.action_handlers = {
+            "run_job": self._start_run_job,
+            "query_history": self._start_query_history,
+        }
 
     def is_waiting_for_input(self) -> bool:
         """Returns True if the manager is waiting for a follow-up response."""
@@ -44,11 +74,11 @@ class ConversationManager:
                 keys_to_save = []
             else:
                 # Parse comma/space separated keys
-                parts = [p.strip() for p in reply.replace(" ", ",").split(",") if p.strip()]
+                parts = _SAVE_KEY_RE.findall(reply)
                 if parts:
-                    known = set(self._context.keys())
-                    keys_to_save = [k for k in parts if k in known]
-                    unknown = [k for k in parts if k not in known]
+                    # The context dict itself gives O(1) membership; no key set copy needed
+                    keys_to_save = [k for k in parts if k in self._context]
+                    unknown = [k for k in parts if k not in self._context]
                     if unknown:
                         logger.warning("Ignoring unknown keys in save selection: %s", ", ".join(unknown))
                 else:
@@ -101,24 +131,28 @@ class ConversationManager:
         # State 3: New conversation
         intent = self.intent_classifier.classify(prompt)
         logger.debug("Classified intent: %s", intent)
-        if intent == "query_history":
-            logger.debug("Dispatching to QueryHistoryAction")
-            response = self.query_history_action.run(prompt=prompt)
-            return response, None, False
-        else:
-            # Default to running a job for any non-query intent
-            logger.debug("Dispatching to RunJobAction")
-            result: ActionResult = self.run_job_action.run(prompt=prompt, context={})
-            response = result.message
-            job_id = result.job_id
-            is_waiting = result.is_waiting
-            if is_waiting:
-                self._is_waiting = True
-                self._pending_action = self.run_job_action
-                self._pending_prompt = prompt
-                self._param_needed = result.param_needed
-                logger.debug("Waiting for parameter: %s", self._param_needed)
-            return response, job_id, is_waiting
+        handler = self.action_handlers.get(intent, self._start_run_job)
+        return handler(prompt)
+
+    def _start_query_history(self, prompt: str):
+        logger.debug("Dispatching to QueryHistoryAction")
+        response = self.query_history_action.run(prompt=prompt)
+        return response, None, False
+
+    def _start_run_job(self, prompt: str):
+        # Default to running a job for any non-query intent
+        logger.debug("Dispatching to RunJobAction")
+        result: ActionResult = self.run_job_action.run(prompt=prompt, context={})
+        response = result.message
+        job_id = result.job_id
+        is_waiting = result.is_waiting
+        if is_waiting:
+            self._is_waiting = True
+            self._pending_action = self.run_job_action
+            self._pending_prompt = prompt
+            self._param_needed = result.param_needed
+            logger.debug("Waiting for parameter: %s", self._param_needed)
+        return response, job_id, is_waiting
 
     def _save_context_to_profile(self, selected_keys: Optional[list[str]] = None):
         """Loads the user profile, updates it with the context (optionally restricted to selected_keys), and saves it.
@@ -129,14 +163,15 @@ class ConversationManager:
         if not self.user_profile_path:
             return  # Should not happen in this flow
 
-        config_manager = ConfigManager(config_path=self.user_profile_path)
+        if self._config_manager is None:
+            self._config_manager = ConfigManager(config_path=self.user_profile_path)
+        config_manager = self._config_manager
         try:
             config = config_manager.load()
         except Exception as e:
             # Build a minimal config and proceed
             logger.warning("Profile load failed at %s (%s). Creating minimal config to persist selected keys.", self.user_profile_path, e)
             try:
-                from jobsherpa.config import UserConfig, UserConfigDefaults
                 config = UserConfig(defaults=UserConfigDefaults(workspace="", system=""))
             except Exception:
                 # Last resort: do nothing
@@ -150,8 +185,7 @@ class ConversationManager:
         for key, value in items:
             try:
                 # Expand env vars and user in workspace before saving
-                if key == "workspace" and isinstance(value, str):
-                    import os
+                if key == "workspace" and isinstance(value, str) and ("~" in value or "$" in value):
                     value = os.path.expandvars(os.path.expanduser(value))
                 setattr(config.defaults, key, value)
             except Exception:
@@ -1,3 +1,5 @@
+import re
+
 class IntentClassifier:
     """
     A simple, keyword-based classifier to determine user intent.
@@ -8,6 +10,13 @@ class IntentClassifier:
             "query_history": ["what was", "result", "status", "tell me about", "get the result"],
             # 'run_job' is the default if no other intent is found.
         }
+        # One case-insensitive alternation per intent, checked in order, so a
+        # prompt is scanned once per intent rather than once per keyword.
+        self._intent_res = [
+            (intent, re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE))
+            for intent, keywords in self.intent_keywords.items()
+        ]
+        self._unknown_re = re.compile(re.escape("what is the weather"), re.IGNORECASE)
 
     def classify(self, prompt: str) -> str:
         """
@@ -19,15 +28,13 @@ class IntentClassifier:
         Returns:
             The classified intent as a string (e.g., 'run_job', 'query_history').
         """
-        lower_prompt = prompt.lower()
-        
-        for intent, keywords in self.intent_keywords.items():
-            if any(keyword in lower_prompt for keyword in keywords):
+        for intent, intent_re in self._intent_res:
+            if intent_re.search(prompt):
                 return intent
         
         # If no specific keywords are matched, assume the user wants to run a job.
         # A more advanced classifier would have a dedicated 'unknown' or 'clarification' intent.
-        if "what is the weather" in lower_prompt:
+        if self._unknown_re.search(prompt):
              return "unknown"
 
         return "run_job"
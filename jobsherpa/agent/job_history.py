@@ -1,117 +1,459 @@
 import time
 import re
 import logging
+import functools
+import mmap
+import threading
+from types import MappingProxyType
 from typing import Optional
 import os
 import json
 
+try:  # orjson parses and emits history.json several times faster than stdlib json
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 from jobsherpa.agent.scheduler import SchedulerClient, SlurmSchedulerClient
 
+# Statuses that still need polling; everything else is terminal.
+_ACTIVE_STATES = frozenset({"PENDING", "RUNNING"})
+# Final statuses get_status serves from history without asking the scheduler.
+_TERMINAL_STATES = frozenset({"COMPLETED", "FAILED", "CANCELLED", "TIMEOUT"})
+# Each status check that finds a job unchanged stretches that job's TTL by
+# this factor, up to _MAX_TTL_FACTOR times status_ttl; any change resets it.
+_TTL_BACKOFF = 1.5
+_MAX_TTL_FACTOR = 6.0
+# Output files smaller than this are read outright instead of memory-mapped.
+_MMAP_MIN_SIZE = 64 * 1024
+# Minimum journal length before it is folded into a new snapshot; beyond that
+# it may grow to twice the number of jobs, so a snapshot rewrite stays
+# amortized O(1) per change however large the history gets.
+_JOURNAL_COMPACT_AT = 256
+
+
+def _loads(raw: bytes):
+    """Decode history JSON; orjson's decode error subclasses json.JSONDecodeError."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data) -> bytes:
+    """Encode history JSON as indented UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=4).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_parser(pattern: str) -> "re.Pattern[str]":
+    """Compiled output-parser regex; job records store only the pattern string."""
+    return re.compile(pattern)
+
+
+# Escapes that mean the same in str and bytes patterns; \w, \d, \s, \b and
+# friends are Unicode-aware only in str patterns, and \x, \u, \N or octal
+# escapes can name non-ASCII characters.
+_BYTES_SAFE_ESCAPES = frozenset("ntrfvAZ")
+_INLINE_FLAGS = frozenset("aiLmsux")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_bytes_parser(pattern: str) -> "Optional[re.Pattern[bytes]]":
+    """
+    The output-parser regex compiled as bytes, to search a memory-mapped file,
+    or None unless the bytes pattern provably matches exactly what the str
+    pattern would. That needs an ASCII pattern with no Unicode-aware escapes,
+    no inline flags (e.g. (?i)), and no "." or negated class, which could stop
+    inside a multi-byte character.
+    """
+    if not pattern.isascii():
+        return None
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            escaped = pattern[i + 1:i + 2]
+            if escaped.isalnum() and escaped not in _BYTES_SAFE_ESCAPES:
+                return None
+            i += 2
+            continue
+        if char == ".":
+            return None
+        if char == "[" and pattern[i + 1:i + 2] == "^":
+            return None
+        if char == "(" and pattern[i + 1:i + 2] == "?" and pattern[i + 2:i + 3] in _INLINE_FLAGS:
+            return None
+        i += 1
+    return re.compile(pattern.encode("ascii"))
+
+
+def _dumps_line(data) -> bytes:
+    """Encode one compact, newline-terminated journal record."""
+    if orjson is not None:
+        return orjson.dumps(data) + b"\n"
+    return json.dumps(data, separators=(",", ":")).encode("utf-8") + b"\n"
+
 
 class JobHistory:
     """
     Manages the state of active and completed jobs, with persistence.
     """
-    def __init__(self, history_file_path: Optional[str] = None, scheduler_client: Optional[SchedulerClient] = None):
+    def __init__(
+        self,
+        history_file_path: Optional[str] = None,
+        scheduler_client: Optional[SchedulerClient] = None,
+        status_ttl: float = 5.0,
+    ):
         self.history_file_path = history_file_path
+        # Guards _jobs, the state derived from it and the files on disk, so
+        # callers on different threads never see a half-applied update or
+        # interleave writes. Scheduler queries run outside it.
+        self._lock = threading.RLock()
+        # history.json is a full snapshot; each change after it is appended to
+        # a journal of whole job records next to it, so an update writes one
+        # record instead of the full history. Loading replays the journal over
+        # the snapshot, and the journal is folded into a new snapshot once it
+        # is full (see _journal_full) or holds unusable lines. Each snapshot
+        # has a new generation stamped on the journal records written after
+        # it, so records from an older journal that outlived its snapshot
+        # (e.g. a crash between the two file operations) are never replayed.
+        self._journal_path = f"{history_file_path}.journal" if history_file_path else None
+        self._generation = 0
+        self._journal_entries = 0
+        self._journal_stale = False
+        # (snapshot mtime_ns, journal size) as of our last load or write; reads
+        # reload from disk only when another writer has changed either since.
+        self._sync_marker = (-1, -1)
         self._jobs = self._load_state()
+        # Derived from _jobs on every (re)load and kept in step with it after:
+        # an ordered set (dict keys) of jobs in an active state, so a polling
+        # cycle with nothing to do returns without a scan, and the most recent
+        # job as (start_time, job_id), so latest-job lookups need no scan.
+        # _jobs_view is the read-only view handed out by get_all_jobs.
+        self._jobs_view = MappingProxyType(self._jobs)
+        self._active_ids: dict[str, None] = {}
+        self._latest: Optional[tuple[float, str]] = None
+        self._reindex()
         # Use provided scheduler client or default to Slurm
         self.scheduler_client = scheduler_client or SlurmSchedulerClient()
+        # Scheduler lookups within status_ttl seconds of the last one are served
+        # from memory, so a single prompt never queries squeue/sacct twice.
+        self.status_ttl = status_ttl
+        self._status_checked_at: dict[str, float] = {}
+        # job_id -> consecutive checks that found no change (see _status_ttl_for)
+        self._stable_checks: dict[str, int] = {}
+        # job_id -> (output file mtime_ns, parsed result) for terminal jobs
+        self._result_cache: dict[str, tuple[int, Optional[str]]] = {}
 
     def _load_state(self) -> dict:
-        """Loads the job history from the JSON file."""
-        if self.history_file_path and os.path.exists(self.history_file_path):
+        """Loads the job history snapshot and replays the journal over it."""
+        jobs: dict = {}
+        self._generation = 0
+        self._journal_entries = 0
+        self._journal_stale = False
+        if not self.history_file_path:
+            return jobs
+        self._sync_marker = self._current_marker()
+        if os.path.exists(self.history_file_path):
             try:
-                with open(self.history_file_path, 'r') as f:
+                with open(self.history_file_path, 'rb') as f:
                     logger.debug("Loading job history from %s", self.history_file_path)
-                    return json.load(f)
+                    jobs = _loads(f.read())
             except (json.JSONDecodeError, IOError) as e:
                 logger.error("Failed to load job history file: %s", e)
-        return {}
+        # {"generation": ..., "jobs": {...}}; a bare jobs dict is generation 0
+        if isinstance(jobs, dict) and set(jobs) == {"generation", "jobs"} and isinstance(jobs["jobs"], dict):
+            self._generation = jobs["generation"]
+            jobs = jobs["jobs"]
+        try:
+            with open(self._journal_path, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = _loads(line)
+                    except json.JSONDecodeError:
+                        # A torn final line from an interrupted append
+                        logger.warning("Skipping unreadable job history journal entry in %s", self._journal_path)
+                        self._journal_stale = True
+                        continue
+                    if not isinstance(record, dict):
+                        continue
+                    generation = record.get("generation", 0)
+                    job = record.get("job", record)
+                    if generation != self._generation:
+                        # Written against an older snapshot that already has it
+                        self._journal_stale = True
+                        continue
+                    if isinstance(job, dict) and "job_id" in job:
+                        jobs[job["job_id"]] = job
+                        self._journal_entries += 1
+        except FileNotFoundError:
+            pass
+        except IOError as e:
+            logger.error("Failed to read job history journal: %s", e)
+        return jobs
+
+    def _journal_full(self, incoming: int) -> bool:
+        return self._journal_entries + incoming >= max(_JOURNAL_COMPACT_AT, 2 * len(self._jobs))
+
+    def _current_marker(self) -> tuple[int, int]:
+        try:
+            snapshot_mtime_ns = os.stat(self.history_file_path).st_mtime_ns
+        except OSError:
+            snapshot_mtime_ns = -1
+        try:
+            journal_size = os.stat(self._journal_path).st_size
+        except OSError:
+            journal_size = -1
+        return (snapshot_mtime_ns, journal_size)
+
+    def _ensure_fresh(self):
+        """Reloads the in-memory history if the files changed since we last synced."""
+        if not self.history_file_path:
+            return
+        with self._lock:
+            if self._current_marker() != self._sync_marker:
+                logger.debug("Job history file changed on disk; reloading %s", self.history_file_path)
+                # Reload in place so the view from get_all_jobs stays live
+                jobs = self._load_state()
+                self._jobs.clear()
+                self._jobs.update(jobs)
+                self._reindex()
+
+    def _reindex(self):
+        """Rebuilds the state derived from _jobs after it was (re)loaded."""
+        self._active_ids = {job_id: None for job_id, data in self._jobs.items() if data.get("status") in _ACTIVE_STATES}
+        self._latest = None
+        if self._jobs:
+            latest_job_id = max(self._jobs, key=lambda j: self._jobs[j].get("start_time", 0))
+            self._latest = (self._jobs[latest_job_id].get("start_time", 0), latest_job_id)
 
     def _save_state(self):
-        """Saves the current job history to the JSON file."""
+        """Saves the full job history snapshot and clears the journal it supersedes."""
         if self.history_file_path:
+            # Write a temp file and rename it over the snapshot so a crash
+            # mid-save never leaves a truncated history behind.
+            tmp_path = f"{self.history_file_path}.{os.getpid()}.tmp"
             try:
-                with open(self.history_file_path, 'w') as f:
-                    json.dump(self._jobs, f, indent=4)
-                    logger.debug("Saved job history to %s", self.history_file_path)
+                try:
+                    try:
+                        f = open(tmp_path, 'wb')
+                    except FileNotFoundError:
+                        # The history directory was removed since it was created
+                        os.makedirs(os.path.dirname(os.path.abspath(tmp_path)), exist_ok=True)
+                        f = open(tmp_path, 'wb')
+                    # Unique across writers, and always new for this one
+                    generation = max(self._generation + 1, time.time_ns())
+                    with f:
+                        f.write(_dumps({"generation": generation, "jobs": self._jobs}))
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(tmp_path, self.history_file_path)
+                except OSError:
+                    try:
+                        os.remove(tmp_path)
+                    except OSError:
+                        pass
+                    raise
+                logger.debug("Saved job history to %s", self.history_file_path)
+                self._generation = generation
+                self._journal_entries = 0
+                self._journal_stale = False
+                try:
+                    os.remove(self._journal_path)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    # Its records carry the old generation and are skipped on
+                    # load, but a torn tail must not be appended after.
+                    logger.warning("Failed to remove superseded job history journal: %s", e)
+                    self._journal_stale = True
+                self._sync_marker = self._current_marker()
             except IOError as e:
                 logger.error("Failed to save job history file: %s", e)
 
+    def _record_changes(self, job_ids: list[str]):
+        """Persists the given jobs by appending their records to the journal."""
+        if not self.history_file_path or not job_ids:
+            return
+        # Without a snapshot there is nothing to journal against; a full
+        # journal is folded into a fresh snapshot instead of growing further,
+        # and appending after a torn or superseded line would corrupt the next
+        # record or keep dead records around.
+        if self._sync_marker[0] == -1 or self._journal_stale or self._journal_full(len(job_ids)):
+            self._save_state()
+            return
+        try:
+            with open(self._journal_path, 'ab') as f:
+                f.write(b"".join(_dumps_line({"generation": self._generation, "job": self._jobs[job_id]}) for job_id in job_ids))
+            self._journal_entries += len(job_ids)
+            self._sync_marker = self._current_marker()
+        except FileNotFoundError:
+            # The history directory (and the snapshot with it) is gone; write
+            # a fresh snapshot, which recreates the directory.
+            self._save_state()
+        except IOError as e:
+            logger.error("Failed to append to job history journal: %s", e)
+
     def register_job(self, job_id: str, job_name: str, job_directory: str, output_parser_info: Optional[dict] = None):
         """
         Registers a new job with a default 'PENDING' status.
         """
-        if job_id not in self._jobs:
-            self._jobs[job_id] = {
-                "job_id": job_id, # Also store the ID inside the object
-                "job_name": job_name,
-                "status": "PENDING",
-                "start_time": time.time(),
-                "job_directory": job_directory,
-                "output_parser": output_parser_info,
-                "result": None
-            }
-            logger.info("Registered new job: %s (%s) in directory: %s", job_id, job_name, job_directory)
-            self._save_state()
+        with self._lock:
+            self._ensure_fresh()
+            if job_id not in self._jobs:
+                self._jobs[job_id] = {
+                    "job_id": job_id, # Also store the ID inside the object
+                    "job_name": job_name,
+                    "status": "PENDING",
+                    "start_time": time.time(),
+                    "job_directory": job_directory,
+                    "output_parser": output_parser_info,
+                    "result": None
+                }
+                self._active_ids[job_id] = None
+                start_time = self._jobs[job_id]["start_time"]
+                if self._latest is None or start_time > self._latest[0]:
+                    self._latest = (start_time, job_id)
+                logger.info("Registered new job: %s (%s) in directory: %s", job_id, job_name, job_directory)
+                self._record_changes([job_id])
+                # Compile the output parser now, so a bad pattern is reported at
+                # submission rather than when the job completes, and the parse on
+                # completion finds it already compiled.
+                regex_pattern = (output_parser_info or {}).get("parser_regex")
+                if regex_pattern:
+                    try:
+                        _compile_parser(regex_pattern)
+                    except re.error as e:
+                        logger.warning("Invalid output parser regex for job %s (%r): %s", job_id, regex_pattern, e)
 
     def get_status(self, job_id: str) -> Optional[str]:
         """
         Gets the status of a specific job. If the job is in a non-terminal
         state, it actively checks for an update before returning.
         """
+        self._ensure_fresh()
         current_status = self._jobs.get(job_id, {}).get("status")
 
         # If we don't know the job, or it's already finished, return the stored status.
-        if not current_status or current_status in ["COMPLETED", "FAILED", "CANCELLED", "TIMEOUT"]:
+        if not current_status or current_status in _TERMINAL_STATES:
             return current_status
 
         # Otherwise, the job is PENDING or RUNNING, so check for a real-time update.
         logger.debug("Actively checking status for non-terminal job: %s", job_id)
-        self.check_and_update_statuses(specific_job_id=job_id)
+        self.refresh_statuses([job_id])
 
         # Return the potentially updated status
         return self._jobs.get(job_id, {}).get("status")
 
     def set_status(self, job_id: str, new_status: str):
         """
-        Updates the status of a specific job.
+        Updates the status of a specific job. Nothing is written when the
+        update leaves the job unchanged.
         """
-        if job_id in self._jobs:
-            if self._jobs[job_id]["status"] != new_status:
-                logger.info("Job %s status changed to: %s", job_id, new_status)
-            self._jobs[job_id]["status"] = new_status
-            # If job is done, try to parse its output
-            if new_status == "COMPLETED" and self._jobs[job_id].get("output_parser"):
-                self._parse_job_output(job_id)
-            self._save_state()
+        with self._lock:
+            if job_id in self._jobs and self._apply_status(job_id, new_status):
+                self._record_changes([job_id])
+
+    def _apply_status(self, job_id: str, new_status: str) -> bool:
+        """Records a status in memory without saving; returns True if the job changed."""
+        job_info = self._jobs[job_id]
+        changed = job_info["status"] != new_status
+        if changed:
+            logger.info("Job %s status changed to: %s", job_id, new_status)
+        job_info["status"] = new_status
+        if new_status in _ACTIVE_STATES:
+            self._active_ids[job_id] = None
+        else:
+            self._active_ids.pop(job_id, None)
+        # If job just finished (or finished without a result yet), parse its output
+        if (new_status == "COMPLETED" and job_info.get("output_parser")
+                and (changed or job_info.get("result") is None)):
+            changed = self._parse_job_output(job_id, save=False) or changed
+        return changed
     
     def get_result(self, job_id: str) -> Optional[str]:
         """Gets the parsed result of a completed job."""
+        self._ensure_fresh()
         return self._jobs[job_id].get("result") if job_id in self._jobs else None
 
     def check_job_status(self, job_id: str) -> Optional[str]:
         """Public helper to actively refresh and return the current status for a job."""
+        self._ensure_fresh()
         if job_id not in self._jobs:
             return None
-        self.check_and_update_statuses(specific_job_id=job_id)
+        self.refresh_statuses([job_id])
         return self._jobs.get(job_id, {}).get("status")
 
+    def refresh_statuses(self, job_ids: list[str]) -> dict:
+        """
+        Refreshes the given jobs with one batched scheduler query, skipping jobs
+        already in a terminal state and any job that was already checked within
+        the last `status_ttl` seconds. Returns the current status of each known job.
+        """
+        self._ensure_fresh()
+        now = time.monotonic()
+
+        def is_stale(job_id: str) -> bool:
+            return now - self._status_checked_at.get(job_id, float("-inf")) >= self._status_ttl_for(job_id)
+
+        with self._lock:
+            stale = [
+                job_id for job_id in dict.fromkeys(job_ids)
+                if job_id in self._jobs and self._jobs[job_id].get("status") not in _TERMINAL_STATES and is_stale(job_id)
+            ]
+            if stale:
+                # The scheduler query costs the same for one id as for many, so
+                # refresh every other stale active job with it; lookups for those
+                # jobs within the TTL are then served without another query.
+                requested = set(stale)
+                stale.extend(job_id for job_id in self._active_ids if job_id not in requested and is_stale(job_id))
+        if stale:
+            self._update_statuses(stale)
+        return {job_id: self._jobs[job_id].get("status") for job_id in job_ids if job_id in self._jobs}
+
+    def _status_ttl_for(self, job_id: str) -> float:
+        """
+        How long a job's last scheduler answer stays fresh. Jobs that keep
+        reporting the same status (e.g. a long RUNNING job) are polled less
+        and less often; a job that just changed is back to status_ttl.
+        """
+        factor = min(_TTL_BACKOFF ** self._stable_checks.get(job_id, 0), _MAX_TTL_FACTOR)
+        return self.status_ttl * factor
+
     def get_job_by_id(self, job_id: str) -> Optional[dict]:
         """Returns all information for a specific job ID."""
+        self._ensure_fresh()
         return self._jobs.get(job_id)
 
+    def get_full_summary(self, job_id: str) -> Optional[dict]:
+        """
+        Returns the stored info, refreshed status, and best available result for
+        a job in a single call (one scheduler query, at most one output parse).
+
+        Returns:
+            A dict with 'info', 'status' and 'result' keys, or None if the job
+            is unknown.
+        """
+        self._ensure_fresh()
+        job_info = self._jobs.get(job_id)
+        if not job_info:
+            return None
+        status = self.refresh_statuses([job_id]).get(job_id)
+        result = job_info.get("result")
+        if result is None:
+            result = self.try_parse_result(job_id)
+        return {"info": job_info, "status": status, "result": result}
+
     def get_latest_job_id(self) -> Optional[str]:
         """Returns the ID of the most recently submitted job."""
-        if not self._jobs:
-            return None
-        
-        # Find the job with the maximum start_time
-        latest_job_id = max(self._jobs, key=lambda j: self._jobs[j].get("start_time", 0))
-        return latest_job_id
+        self._ensure_fresh()
+        return self._latest[1] if self._latest else None
 
     def get_latest_job(self) -> Optional[dict]:
         """
@@ -126,15 +468,22 @@ class JobHistory:
             return self.get_job_by_id(latest_job_id)
         return None
 
-    def get_all_jobs(self) -> dict:
-        """Returns the entire dictionary of jobs."""
-        return self._jobs
+    def get_all_jobs(self) -> MappingProxyType:
+        """
+        Returns a read-only, live view of all jobs keyed by job ID.
+        Changes must go through register_job/set_status.
+        """
+        self._ensure_fresh()
+        return self._jobs_view
 
-    def _parse_job_output(self, job_id: str):
-        """Parses the output file of a completed job to find a result."""
+    def _parse_job_output(self, job_id: str, save: bool = True) -> bool:
+        """
+        Parses the output file of a completed job to find a result.
+        Returns True if the stored result changed (and was saved, unless save=False).
+        """
         job_info = self._jobs.get(job_id)
         if not job_info or not job_info.get("output_parser"):
-            return
+            return False
 
         parser_info = job_info["output_parser"]
         relative_output_file = parser_info.get("file")
@@ -143,28 +492,45 @@ class JobHistory:
 
         if not all([relative_output_file, job_directory, regex_pattern]):
             logger.warning("Job %s missing parsing info. file=%s dir=%s regex=%s", job_id, relative_output_file, job_directory, bool(regex_pattern))
-            return
+            return False
 
         # The output file path is now relative to the job's unique directory
         output_file_path = os.path.join(job_directory, relative_output_file)
         
         logger.info("Parsing output file for job %s: %s", job_id, output_file_path)
         try:
-            with open(output_file_path, 'r') as f:
-                content = f.read()
-            
-            match = re.search(regex_pattern, content)
-            if match:
-                result = match.group(1)
-                self._jobs[job_id]["result"] = result
-                logger.info("Parsed result for job %s: %s", job_id, result)
-                self._save_state() # Save state after successful parsing
-            else:
-                logger.warning("No match in output file for job %s using regex: %s", job_id, regex_pattern)
+            # Large files are searched through a read-only mapping rather than
+            # reading a potentially huge log into memory, but only with a bytes
+            # pattern that matches exactly like the str one; everything else is
+            # read and decoded outright so the pattern keeps Unicode semantics.
+            result = None
+            with open(output_file_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                bytes_parser = _compile_bytes_parser(regex_pattern) if size >= _MMAP_MIN_SIZE else None
+                if bytes_parser is None:
+                    match = _compile_parser(regex_pattern).search(f.read().decode("utf-8", "replace"))
+                    if match:
+                        result = match.group(1)
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        match = bytes_parser.search(mm)
+                        if match:
+                            result = match.group(1).decode("utf-8", "replace")
+            if result is not None:
+                with self._lock:
+                    if self._jobs[job_id].get("result") == result:
+                        return False
+                    self._jobs[job_id]["result"] = result
+                    logger.info("Parsed result for job %s: %s", job_id, result)
+                    if save:
+                        self._record_changes([job_id]) # Save state after successful parsing
+                return True
+            logger.warning("No match in output file for job %s using regex: %s", job_id, regex_pattern)
         except FileNotFoundError:
             logger.warning("Output file not found for job %s: %s", job_id, output_file_path)
         except Exception as e:
             logger.warning("Error parsing result for job %s from %s: %s", job_id, output_file_path, e, exc_info=True)
+        return False
 
     def _parse_squeue_status(self, job_ids: list[str]) -> dict:
         """Fetch active statuses using the scheduler client (squeue equivalent)."""
@@ -173,23 +539,6 @@ class JobHistory:
             logger.debug("Active status for %s: %s", job_id, state)
         return statuses
 
-    def _normalize_squeue_state(self, squeue_state: str) -> str:
-        """Normalizes various SQUEUE state strings to a common format."""
-        squeue_state = squeue_state.strip()
-        if squeue_state == "PENDING":
-            return "PENDING"
-        if squeue_state == "RUNNING":
-            return "RUNNING"
-        if squeue_state == "COMPLETED":
-            return "COMPLETED"
-        if squeue_state == "FAILED":
-            return "FAILED"
-        if squeue_state == "CANCELLED":
-            return "CANCELLED"
-        if squeue_state == "TIMEOUT":
-            return "TIMEOUT"
-        return squeue_state # Fallback for other states
-
     def _parse_sacct_status(self, job_ids: list[str]) -> dict:
         """Fetch final statuses using the scheduler client (sacct equivalent)."""
         statuses = self.scheduler_client.get_final_statuses(job_ids)
@@ -197,55 +546,52 @@ class JobHistory:
             logger.debug("Final status for %s: %s", job_id, state)
         return statuses
 
-    def _normalize_sacct_state(self, sacct_state: str) -> str:
-        """Normalizes various SACCT state strings to a common format."""
-        sacct_state = sacct_state.strip()
-        if sacct_state == "COMPLETED":
-            return "COMPLETED"
-        if sacct_state == "FAILED":
-            return "FAILED"
-        if sacct_state == "CANCELLED":
-            return "CANCELLED"
-        if sacct_state == "TIMEOUT":
-            return "TIMEOUT"
-        return sacct_state # Fallback for other states
-
     def check_and_update_statuses(self, specific_job_id: Optional[str] = None):
         """
         Checks the system scheduler for the current status of tracked jobs
         that are in non-terminal states.
         """
-        jobs_to_check = []
-        if specific_job_id and specific_job_id in self._jobs:
-            jobs_to_check = [specific_job_id]
-        else: # Check all non-terminal jobs
-            jobs_to_check = [
-                job_id for job_id, data in self._jobs.items() 
-                if data.get("status") in ["PENDING", "RUNNING"]
-            ]
+        with self._lock:
+            if specific_job_id and specific_job_id in self._jobs:
+                # The batched query costs the same for one id as for all of them,
+                # so check every other non-terminal job along with this one.
+                jobs_to_check = list(dict.fromkeys([specific_job_id, *self._active_ids]))
+            else: # Check all non-terminal jobs
+                jobs_to_check = list(self._active_ids)
 
         if not jobs_to_check:
             return
 
+        self._update_statuses(jobs_to_check)
+
+    def _update_statuses(self, jobs_to_check: list[str]):
+        """Queries squeue, then sacct for the remainder, and records the results."""
         logger.debug("Checking statuses for jobs: %s", jobs_to_check)
-        # Check squeue first for active jobs
-        squeue_statuses = self._parse_squeue_status(jobs_to_check)
-        
-        jobs_not_in_squeue = []
+        checked_at = time.monotonic()
         for job_id in jobs_to_check:
-            if job_id in squeue_statuses:
-                self.set_status(job_id, squeue_statuses[job_id])
-            else:
-                jobs_not_in_squeue.append(job_id)
-        
-        # For jobs no longer in squeue, check sacct for final status
+            self._status_checked_at[job_id] = checked_at
+        # Check squeue first for active jobs, then sacct for final status of
+        # jobs no longer in squeue; both run without holding the lock.
+        squeue_statuses = self._parse_squeue_status(jobs_to_check)
+        jobs_not_in_squeue = [job_id for job_id in jobs_to_check if job_id not in squeue_statuses]
+        sacct_statuses: dict = {}
         if jobs_not_in_squeue:
             logger.debug("Jobs not in squeue; checking sacct: %s", jobs_not_in_squeue)
             sacct_statuses = self._parse_sacct_status(jobs_not_in_squeue)
             if not sacct_statuses:
                 logger.warning("sacct returned no statuses for jobs: %s", jobs_not_in_squeue)
-            for job_id, status in sacct_statuses.items():
-                self.set_status(job_id, status)
+
+        # Apply every update in memory and persist the changed jobs once per cycle
+        with self._lock:
+            changed: list[str] = []
+            for statuses in (squeue_statuses, sacct_statuses):
+                for job_id, status in statuses.items():
+                    if job_id in self._jobs and self._apply_status(job_id, status):
+                        changed.append(job_id)
+            self._record_changes(changed)
+            changed_ids = set(changed)
+            for job_id in jobs_to_check:
+                self._stable_checks[job_id] = 0 if job_id in changed_ids else self._stable_checks.get(job_id, 0) + 1
 
     def try_parse_result(self, job_id: str) -> Optional[str]:
         """
@@ -254,6 +600,32 @@ class JobHistory:
         """
         if job_id not in self._jobs:
             return None
+        # Terminal jobs' output no longer changes; reuse the last parse while the
+        # file's mtime is unchanged. Running jobs always re-parse fresh output.
+        mtime_ns = None
+        output_file_path = self._output_file_path(job_id)
+        if output_file_path and self._jobs[job_id].get("status") not in _ACTIVE_STATES:
+            try:
+                mtime_ns = os.stat(output_file_path).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            cached = self._result_cache.get(job_id)
+            if mtime_ns is not None and cached and cached[0] == mtime_ns:
+                logger.debug("Using cached parse result for job %s", job_id)
+                return cached[1]
         logger.debug("Attempting direct parse of result for job %s", job_id)
         self._parse_job_output(job_id)
-        return self._jobs.get(job_id, {}).get("result")
+        result = self._jobs.get(job_id, {}).get("result")
+        if mtime_ns is not None:
+            self._result_cache[job_id] = (mtime_ns, result)
+        return result
+
+    def _output_file_path(self, job_id: str) -> Optional[str]:
+        """Returns the absolute path of a job's parsed output file, if known."""
+        job_info = self._jobs.get(job_id) or {}
+        parser_info = job_info.get("output_parser") or {}
+        relative_output_file = parser_info.get("file")
+        job_directory = job_info.get("job_directory")
+        if not relative_output_file or not job_directory:
+            return None
+        return os.path.join(job_directory, relative_output_file)
@@ -1,11 +1,73 @@
 import os
-import yaml
+import sys
+import json
 import logging
-from typing import List, Optional, Dict, Any
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Tuple
+
+from jobsherpa.util.io import read_yaml_cached, write_json_cache
 
 
 logger = logging.getLogger(__name__)
 
+_PARALLEL_MIN_FILES = 4
+_MAX_WORKERS = 8
+# Parsed recipes for a whole applications/ directory, stored next to the recipes
+# and keyed by a fingerprint of every recipe file's name, mtime and size.
+INDEX_CACHE_NAME = ".recipe_index.cache.json"
+# Process-wide indexes: (absolute knowledge base dir, recipe fingerprint) -> index
+_MAX_SHARED_INDEXES = 4
+_SHARED_INDEXES: Dict[Tuple[str, str], "SimpleKeywordIndex"] = {}
+
+
+def _fingerprint(files: List[Tuple[str, os.stat_result]]) -> str:
+    """Digest of (name, mtime_ns, size) for each recipe; changes when any file does."""
+    stats = sorted((os.path.basename(path), st.st_mtime_ns, st.st_size) for path, st in files)
+    digest = hashlib.blake2b(digest_size=16)
+    for name, mtime_ns, size in stats:
+        digest.update(f"{name}:{mtime_ns}:{size}\n".encode())
+    return digest.hexdigest()
+
+
+def _scan_recipes(app_dir: str) -> List[Tuple[str, os.stat_result]]:
+    """List recipe paths with their stat results in one scandir pass."""
+    files: List[Tuple[str, os.stat_result]] = []
+    try:
+        with os.scandir(app_dir) as entries:
+            for entry in entries:
+                # DirEntry carries the joined path and file type; its stat() is
+                # reused below as the YAML cache key instead of a second os.stat
+                if not entry.name.endswith(".yaml") or not entry.is_file():
+                    continue
+                files.append((entry.path, entry.stat()))
+    except OSError:
+        pass
+    return files
+
+
+def _read_index_cache(cache_path: str, fingerprint: str) -> Optional[List[Dict[str, Any]]]:
+    """Return the cached recipe list if it was built from the same files, else None."""
+    try:
+        with open(cache_path, "r") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("fingerprint") != fingerprint:
+        return None
+    recipes = cached.get("recipes")
+    return recipes if isinstance(recipes, list) else None
+
+
+def _load_recipe(file: Tuple[str, os.stat_result]) -> Any:
+    """Parse one recipe file, returning None (with a warning) if it cannot be read."""
+    path, st = file
+    try:
+        return read_yaml_cached(path, st)
+    except Exception as e:
+        logger.warning("Failed to load recipe %s: %s", path, e)
+        return None
+
 
 class RecipeIndex:
     """
@@ -30,55 +92,105 @@ class SimpleKeywordIndex(RecipeIndex):
     def __init__(self, knowledge_base_dir: str):
         self.knowledge_base_dir = knowledge_base_dir
         self._recipes: List[Dict[str, Any]] = []
+        # Lowercased names, parallel to _recipes, built once per index()
+        self._names: List[str] = []
+        # Lowercased keyword -> indexes of the recipes declaring it (one entry per
+        # declaration), so each distinct keyword is tested against a prompt once
+        self._postings: Dict[str, List[int]] = {}
+        self._indexed = False
 
     def index(self) -> None:
         app_dir = os.path.join(self.knowledge_base_dir, "applications")
         if not os.path.isdir(app_dir):
             logger.warning("Applications directory not found for indexing: %s", app_dir)
             self._recipes = []
+            self._names = []
+            self._postings = {}
+            self._indexed = True
             return
 
-        recipes: List[Dict[str, Any]] = []
-        for filename in os.listdir(app_dir):
-            if filename.endswith(".yaml"):
-                path = os.path.join(app_dir, filename)
-                try:
-                    with open(path, "r") as f:
-                        recipe = yaml.safe_load(f)
-                        if isinstance(recipe, dict):
-                            recipes.append(recipe)
-                except Exception as e:
-                    logger.warning("Failed to load recipe %s: %s", path, e)
+        files = _scan_recipes(app_dir)
+        fingerprint = _fingerprint(files)
+        cache_path = os.path.join(app_dir, INDEX_CACHE_NAME)
+        recipes = _read_index_cache(cache_path, fingerprint)
+        if recipes is None:
+            recipes = self._parse_recipes(files)
+            write_json_cache(cache_path, {"fingerprint": fingerprint, "recipes": recipes})
+        else:
+            logger.debug("Loaded %d recipes from index cache %s", len(recipes), cache_path)
+        # Intern recipe names: every index and later lookup shares one string object
+        for recipe in recipes:
+            if isinstance(recipe.get("name"), str):
+                recipe["name"] = sys.intern(recipe["name"])
         self._recipes = recipes
+        # Tokenize alongside the recipes so the recipe dicts handed to callers stay clean
+        self._names = [sys.intern(str(r.get("name", "")).lower()) for r in recipes]
+        postings: Dict[str, List[int]] = {}
+        for i, recipe in enumerate(recipes):
+            for keyword in recipe.get("keywords") or []:
+                if keyword:
+                    postings.setdefault(sys.intern(keyword.lower()), []).append(i)
+        self._postings = postings
+        self._indexed = True
+
+    @staticmethod
+    def _parse_recipes(files: List[Tuple[str, os.stat_result]]) -> List[Dict[str, Any]]:
+        # Parse on a small thread pool: file reads and libyaml release the GIL.
+        # A handful of recipes is cheaper to parse serially than to start threads for.
+        if len(files) > _PARALLEL_MIN_FILES:
+            with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(files))) as pool:
+                loaded = list(pool.map(_load_recipe, files))
+        else:
+            loaded = [_load_recipe(file) for file in files]
+        return [r for r in loaded if isinstance(r, dict) and r]
 
     def find_best(self, prompt: str) -> Optional[Dict[str, Any]]:
-        if not self._recipes:
+        # Index lazily so sessions that never submit a job never parse recipes
+        if not self._indexed:
             self.index()
         prompt_l = prompt.lower()
+        # Score every recipe once; both the name-filtered pick and the
+        # single-hit fallback below read from this one list.
+        scores = [0] * len(self._recipes)
+        for keyword, recipe_ids in self._postings.items():
+            if keyword in prompt_l:
+                for i in recipe_ids:
+                    scores[i] += 1
         # Pre-filter: prefer recipes whose name appears in the prompt
-        candidates = [r for r in self._recipes if r.get("name", "").lower() in prompt_l]
-        search_space = candidates if candidates else self._recipes
+        candidates = [i for i, name in enumerate(self._names) if name in prompt_l]
+        search_space = candidates if candidates else range(len(self._recipes))
         best_score = 0
         best_recipe = None
-        for recipe in search_space:
-            keywords = [k.lower() for k in recipe.get("keywords", [])]
-            score = sum(1 for k in keywords if k and k in prompt_l)
-            if score > best_score:
-                best_score = score
-                best_recipe = recipe
+        for i in search_space:
+            if scores[i] > best_score:
+                best_score = scores[i]
+                best_recipe = self._recipes[i]
         # Only return if we achieved a positive score (some keyword overlap)
-        if best_recipe is not None and best_score > 0:
+        if best_recipe is not None:
             return best_recipe
         # If no keyword overlap but there is exactly one keyword hit in exactly one recipe, pick it
-        # Compute scores again across full set to detect single-hit case
-        scores = []
-        for recipe in self._recipes:
-            keywords = [k.lower() for k in recipe.get("keywords", [])]
-            score = sum(1 for k in keywords if k and k in prompt_l)
-            scores.append((score, recipe))
-        nonzero = [(s, r) for s, r in scores if s > 0]
+        nonzero = [i for i, score in enumerate(scores) if score > 0]
         if len(nonzero) == 1:
-            return nonzero[0][1]
+            return self._recipes[nonzero[0]]
         return None
 
 
+def shared_keyword_index(knowledge_base_dir: str) -> SimpleKeywordIndex:
+    """
+    Returns a process-wide SimpleKeywordIndex for a knowledge base directory, so
+    repeated agents in one process share one set of parsed, tokenized recipes.
+
+    The index is keyed by the recipe files' fingerprint as well, so an agent
+    created after a recipe is added, removed or edited gets a fresh index.
+    """
+    kb_dir = os.path.abspath(knowledge_base_dir)
+    key = (kb_dir, _fingerprint(_scan_recipes(os.path.join(kb_dir, "applications"))))
+    index = _SHARED_INDEXES.get(key)
+    if index is None:
+        # An older fingerprint of the same directory can never match again
+        for stale in [k for k in _SHARED_INDEXES if k[0] == kb_dir]:
+            del _SHARED_INDEXES[stale]
+        if len(_SHARED_INDEXES) >= _MAX_SHARED_INDEXES:
+            del _SHARED_INDEXES[next(iter(_SHARED_INDEXES))]
+        index = _SHARED_INDEXES[key] = SimpleKeywordIndex(kb_dir)
+    return index
@@ -1,17 +1,29 @@
 import subprocess
 import logging
-from typing import Dict, List
+import re
+from types import MappingProxyType
+from typing import Dict, List, Mapping
 
 
 logger = logging.getLogger(__name__)
 
+# Array task ("123_4", "123_[1-5]") and heterogeneous component ("123+0") suffixes
+_JOB_ID_SUFFIX_RE = re.compile(r"[_+]")
+
 
 class SchedulerClient:
     """
     Abstract interface for querying a scheduler about job statuses.
     Implementations must return normalized status strings.
+
+    ACTIVE_STATE_MAP and FINAL_STATE_MAP translate backend-specific state
+    names (after upper-casing) to the normalized ones; unmapped states pass
+    through unchanged.
     """
 
+    ACTIVE_STATE_MAP: Mapping[str, str] = MappingProxyType({})
+    FINAL_STATE_MAP: Mapping[str, str] = MappingProxyType({})
+
     def get_active_statuses(self, job_ids: List[str]) -> Dict[str, str]:
         """Return statuses for actively running/pending jobs (e.g., via squeue)."""
         raise NotImplementedError
@@ -35,16 +47,16 @@ class SlurmSchedulerClient(SchedulerClient):
             "--noheader",
             "--format=%i,%T",
         ]
-        logger.debug("Running squeue command: %s", " ".join(command))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Running squeue command: %s", " ".join(command))
         result = subprocess.run(command, capture_output=True, text=True)
         if result.stderr:
             logger.warning("squeue returned stderr: %s", result.stderr)
         statuses: Dict[str, str] = {}
         for line in result.stdout.strip().splitlines():
-            parts = line.split(",")
-            if len(parts) == 2:
-                job_id, state = parts[0].strip(), parts[1].strip()
-                statuses[job_id] = self._normalize_active_state(state)
+            job_id, sep, state = line.partition(",")
+            if sep:
+                statuses[job_id.strip()] = self._normalize_active_state(state)
         return statuses
 
     def get_final_statuses(self, job_ids: List[str]) -> Dict[str, str]:
@@ -54,34 +66,41 @@ class SlurmSchedulerClient(SchedulerClient):
             "sacct",
             "--jobs=" + ",".join(job_ids),
             "--noheader",
-            "--format=JobId,State,ExitCode",
+            "--allocations",
+            "--parsable2",
+            "--format=JobId,State",
         ]
-        logger.debug("Running sacct command: %s", " ".join(command))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Running sacct command: %s", " ".join(command))
         result = subprocess.run(command, capture_output=True, text=True)
         if result.stderr:
             logger.warning("sacct returned stderr: %s", result.stderr)
+        wanted = set(job_ids)
         statuses: Dict[str, str] = {}
         for line in result.stdout.strip().splitlines():
-            parts = line.split()
-            if len(parts) > 1:
-                job_id_raw, state = parts[0].strip(), parts[1].strip()
-                # Map to the requested job id(s)
-                for target_id in job_ids:
-                    if job_id_raw.startswith(target_id):
-                        statuses[target_id] = self._normalize_final_state(state)
-                        break
+            # --parsable2 rows are "JobId|State" with no padding
+            job_id_raw, sep, state = line.partition("|")
+            if sep:
+                # Step rows (e.g. "111.batch"), array tasks and heterogeneous
+                # components map back to the requested job id; the first row
+                # for each id is the one reported.
+                target_id = job_id_raw.partition(".")[0]
+                if target_id not in wanted:
+                    target_id = _JOB_ID_SUFFIX_RE.split(target_id, 1)[0]
+                if target_id in wanted and target_id not in statuses:
+                    # Drop qualifiers such as "CANCELLED by 1234"
+                    statuses[target_id] = self._normalize_final_state(state.partition(" ")[0])
         return statuses
 
+    # SLURM's long state names are already the normalized form, so the maps
+    # are empty by default; these hooks canonicalize case and whitespace and
+    # then apply the map with a single lookup, with no per-state branching.
     def _normalize_active_state(self, state: str) -> str:
-        s = state.strip().upper()
-        if s in {"PENDING", "RUNNING"}:
-            return s
-        return s
+        state = state.strip().upper()
+        return self.ACTIVE_STATE_MAP.get(state, state)
 
     def _normalize_final_state(self, state: str) -> str:
-        s = state.strip().upper()
-        if s in {"COMPLETED", "FAILED", "CANCELLED", "TIMEOUT"}:
-            return s
-        return s
+        state = state.strip().upper()
+        return self.FINAL_STATE_MAP.get(state, state)
 
 
@@ -26,7 +26,8 @@ class ToolExecutor:
         else:
             command = [tool_name] + args
 
-        logger.debug("Executing command: %s in workspace: %s", " ".join(command), workspace)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executing command: %s in workspace: %s", " ".join(command), workspace)
 
         if self.dry_run:
             return f"DRY-RUN: Would execute: {' '.join(command)} in workspace: {workspace}"
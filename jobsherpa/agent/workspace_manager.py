@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from pathlib import Path
-import uuid
 import os
+import secrets
 from datetime import datetime
 
 @dataclass
@@ -30,7 +30,7 @@ class WorkspaceManager:
         timestamp = datetime.now().strftime("%Y-%m-%d-%H-%M")
         # Replace problematic characters with underscores
         safe_job_name = job_name.replace(" ", "_").replace("/", "_").replace("-", "_")
-        unique_hash = str(uuid.uuid4().hex)[:6]
+        unique_hash = secrets.token_hex(3)
         
         dir_name = f"{timestamp}-{safe_job_name}-{unique_hash}"
         job_dir = self.base_path / dir_name
@@ -1,12 +1,11 @@
 import typer
 import logging
-import yaml
 import os
 import getpass
-from jobsherpa.util.errors import ExceptionManager
+from jobsherpa.util.io import read_yaml
 from typing import Optional
-# from jobsherpa.agent.agent import JobSherpaAgent # <-- This will be moved
-from jobsherpa.agent.config_manager import ConfigManager
+# Heavier modules (the agent, ConfigManager/ruamel, ExceptionManager/jinja2) are
+# imported inside the commands that need them to keep CLI start-up fast.
 
 app = typer.Typer()
 config_app = typer.Typer()
@@ -31,6 +30,7 @@ def config_set(
     user_profile_path: Optional[str] = typer.Option(None, "--user-profile-path", help="Direct path to the user profile YAML file.", hidden=True),
 ):
     """Set a default configuration value in your user profile."""
+    from jobsherpa.agent.config_manager import ConfigManager
     profile_path = get_user_profile_path(user_profile, user_profile_path)
     manager = ConfigManager(config_path=profile_path)
     
@@ -68,8 +68,7 @@ def config_get(
         raise typer.Exit(1)
         
     try:
-        with open(path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = read_yaml(path)
     except Exception as e:
         from jobsherpa.util.errors import ExceptionManager
         typer.secho(ExceptionManager.handle(e), fg=typer.colors.RED)
@@ -122,7 +121,6 @@ def setup_logging(level: int):
         force=True,
     )
     if level > logging.DEBUG:
-        logging.getLogger("haystack").setLevel(logging.WARNING)
         logging.getLogger("urllib3").setLevel(logging.WARNING)
 
 @app.command()
@@ -188,6 +186,7 @@ def run(
             
     except Exception as e:
         # Always map exceptions to user-friendly messages; avoid raw tracebacks in CLI output
+        from jobsherpa.util.errors import ExceptionManager
         user_msg = ExceptionManager.handle(e, include_trace=False)
         typer.secho(user_msg, fg=typer.colors.RED)
         if debug:
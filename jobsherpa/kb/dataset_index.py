@@ -1,8 +1,8 @@
 import os
-import yaml
 from typing import Dict, Optional
 
 from jobsherpa.kb.models import DatasetProfile
+from jobsherpa.util.io import read_yaml_cached
 
 
 class DatasetIndex:
@@ -15,12 +15,12 @@ class DatasetIndex:
         datasets_dir = os.path.join(self.base_dir, "datasets")
         if not os.path.isdir(datasets_dir):
             return
-        for filename in os.listdir(datasets_dir):
-            if filename.endswith(".yaml"):
-                path = os.path.join(datasets_dir, filename)
+        with os.scandir(datasets_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".yaml") or not entry.is_file():
+                    continue
                 try:
-                    with open(path, "r") as f:
-                        data = yaml.safe_load(f) or {}
+                    data = read_yaml_cached(entry.path, entry.stat())
                     try:
                         profile = DatasetProfile.model_validate(data)  # type: ignore[attr-defined]
                     except AttributeError:
@@ -1,13 +1,12 @@
 import os
-import yaml
 from typing import Optional
 
 from jobsherpa.kb.models import SystemProfile, ApplicationRecipe, DatasetProfile
+from jobsherpa.util.io import read_yaml_cached
 
 
 def _read_yaml(path: str) -> dict:
-    with open(path, "r") as f:
-        return yaml.safe_load(f) or {}
+    return read_yaml_cached(path)
 
 
 def load_system_profile_file(path: str) -> SystemProfile:
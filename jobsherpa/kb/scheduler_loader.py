@@ -1,10 +1,9 @@
 import os
-import yaml
 from typing import Optional
 import logging
 
 from jobsherpa.kb.models import SchedulerProfile
-from jobsherpa.util.io import read_yaml
+from jobsherpa.util.io import read_yaml_cached
 
 logger = logging.getLogger(__name__)
 
@@ -13,7 +12,7 @@ def load_scheduler_profile(name: str, base_dir: str = "knowledge_base") -> Optio
     path = os.path.join(base_dir, "schedulers", f"{name}.yaml")
     if not os.path.exists(path):
         return None
-    data = read_yaml(path)
+    data = read_yaml_cached(path)
     try:
         logger.debug("Loading scheduler profile from KB: %s", path)
         return SchedulerProfile.model_validate(data)  # type: ignore[attr-defined]
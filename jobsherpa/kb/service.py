@@ -1,8 +1,10 @@
 import os
+import copy
 import logging
-from typing import Optional, Tuple
+import functools
+from typing import Dict, Optional, Tuple
 
-from jobsherpa.util.io import read_yaml
+from jobsherpa.util.io import read_yaml_cached
 from jobsherpa.kb.models import SystemProfile, SchedulerProfile, SiteProfile
 
 logger = logging.getLogger(__name__)
@@ -13,13 +15,28 @@ class KnowledgeBaseService:
 
 	def __init__(self, base_dir: str = "knowledge_base") -> None:
 		self.base_dir = base_dir
+		# path -> ((mtime_ns, size), data, model): validated system profiles reused until the file changes
+		self._system_cache: Dict[str, tuple] = {}
+
+	def clear_cache(self) -> None:
+		"""Forget all memoized profiles (mainly for tests that rewrite KB files)."""
+		self._system_cache.clear()
 
 	def load_system(self, name: str) -> Tuple[Optional[dict], Optional[SystemProfile]]:
 		path = os.path.join(self.base_dir, "system", f"{name}.yaml")
 		if not os.path.exists(path):
 			return None, None
 		logger.debug("KB_LOAD kind=system path=%s name=%s", path, name)
-		data = read_yaml(path)
+		try:
+			st = os.stat(path)
+			key: Optional[tuple] = (st.st_mtime_ns, st.st_size)
+		except OSError:
+			key = None
+		cached = self._system_cache.get(path)
+		if key is not None and cached is not None and cached[0] == key:
+			# Callers mutate the dict (e.g. merging scheduler commands); hand out a copy
+			return copy.deepcopy(cached[1]), cached[2]
+		data = read_yaml_cached(path)
 		model: Optional[SystemProfile] = None
 		try:
 			model = SystemProfile.model_validate(data)  # type: ignore[attr-defined]
@@ -28,6 +45,8 @@ class KnowledgeBaseService:
 				model = SystemProfile.parse_obj(data)  # type: ignore[attr-defined]
 			except Exception:
 				model = None
+		if key is not None:
+			self._system_cache[path] = (key, copy.deepcopy(data), model)
 		return data, model
 
 	def load_scheduler_profile(self, name: str) -> Optional[SchedulerProfile]:
@@ -35,7 +54,7 @@ class KnowledgeBaseService:
 		if not os.path.exists(path):
 			return None
 		logger.debug("KB_LOAD kind=scheduler path=%s name=%s", path, name)
-		data = read_yaml(path)
+		data = read_yaml_cached(path)
 		try:
 			return SchedulerProfile.model_validate(data)  # type: ignore[attr-defined]
 		except AttributeError:
@@ -46,7 +65,7 @@ class KnowledgeBaseService:
 		if not os.path.exists(path):
 			return None
 		logger.debug("KB_LOAD kind=site path=%s name=%s", path, name)
-		data = read_yaml(path)
+		data = read_yaml_cached(path)
 		try:
 			return SiteProfile.model_validate(data)  # type: ignore[attr-defined]
 		except AttributeError:
@@ -56,13 +75,21 @@ class KnowledgeBaseService:
 		site_dir = os.path.join(self.base_dir, "site")
 		if not os.path.isdir(site_dir):
 			return None
-		for fname in os.listdir(site_dir):
-			if not fname.endswith(".yaml"):
-				continue
-			name = os.path.splitext(fname)[0]
+		system_l = system_name.lower()
+		with os.scandir(site_dir) as entries:
+			names = [os.path.splitext(e.name)[0] for e in entries if e.name.endswith(".yaml") and e.is_file()]
+		for name in names:
 			site = self.load_site_profile(name)
-			if site and any(s.lower() == system_name.lower() for s in site.systems):
+			if site and any(s.lower() == system_l for s in site.systems):
 				return site
 		return None
 
 
+def get_kb_service(base_dir: str = "knowledge_base") -> KnowledgeBaseService:
+	"""Return the process-wide KnowledgeBaseService for base_dir, so its caches survive across agents."""
+	return _get_kb_service(os.path.abspath(base_dir))
+
+
+@functools.lru_cache(maxsize=8)
+def _get_kb_service(base_dir: str) -> KnowledgeBaseService:
+	return KnowledgeBaseService(base_dir=base_dir)
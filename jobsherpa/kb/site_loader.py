@@ -1,17 +1,16 @@
 import os
-import yaml
 from typing import Optional
 
 from jobsherpa.kb.models import SiteProfile
 from jobsherpa.kb.loader import load_system_profile
+from jobsherpa.util.io import read_yaml_cached
 
 
 def load_site_profile(name: str, base_dir: str = "knowledge_base") -> Optional[SiteProfile]:
     path = os.path.join(base_dir, "site", f"{name}.yaml")
     if not os.path.exists(path):
         return None
-    with open(path, "r") as f:
-        data = yaml.safe_load(f) or {}
+    data = read_yaml_cached(path)
     try:
         return SiteProfile.model_validate(data)  # type: ignore[attr-defined]
     except AttributeError:
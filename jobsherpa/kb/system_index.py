@@ -1,8 +1,8 @@
 import os
-import yaml
 from typing import Dict, Optional
 
 from jobsherpa.kb.models import SystemProfile
+from jobsherpa.util.io import read_yaml_cached
 
 
 class SystemIndex:
@@ -14,12 +14,12 @@ class SystemIndex:
         systems_dir = os.path.join(self.base_dir, "system")
         if not os.path.isdir(systems_dir):
             return
-        for filename in os.listdir(systems_dir):
-            if filename.endswith(".yaml"):
-                path = os.path.join(systems_dir, filename)
+        with os.scandir(systems_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".yaml") or not entry.is_file():
+                    continue
                 try:
-                    with open(path, "r") as f:
-                        data = yaml.safe_load(f) or {}
+                    data = read_yaml_cached(entry.path, entry.stat())
                     try:
                         profile = SystemProfile.model_validate(data)  # type: ignore[attr-defined]
                     except AttributeError:
@@ -1,13 +1,109 @@
+import os
+import copy
+import json
 import yaml
 import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+try:  # libyaml-backed loader is several times faster when available
+	from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+	from yaml import SafeLoader
 
 logger = logging.getLogger(__name__)
 
+# Parsed YAML is mirrored into a JSON file next to the source; JSON parses far
+# faster than YAML and carries data only (unlike pickle), so it is safe to load
+# from shared knowledge base directories.
+SIDECAR_SUFFIX = ".cache.json"
+
+# Process-wide LRU of parsed YAML: path -> (mtime_ns, size, data)
+_YAML_CACHE_MAX = 100
+_yaml_cache: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+# Guards _yaml_cache bookkeeping; parsing itself happens outside the lock
+_yaml_cache_lock = threading.Lock()
+
+
+def read_yaml(path: str, st: Optional[os.stat_result] = None):
+	"""Read a YAML file with a debug log of the access.
 
-def read_yaml(path: str):
-	"""Read a YAML file with a debug log of the access."""
+	The YAML file stays the source of truth: its JSON sidecar records the
+	(mtime_ns, size) of the YAML it was built from and is only used while that
+	matches exactly, so a replacement with an older mtime is still picked up.
+	The sidecar is rewritten after every real parse. Callers that already hold
+	a stat result for path may pass it as st.
+	"""
+	if st is None:
+		try:
+			st = os.stat(path)
+		except OSError:
+			st = None
 	logger.debug("Reading YAML file: %s", path)
-	with open(path, "r") as f:
-		return yaml.safe_load(f) or {}
+	sidecar = path + SIDECAR_SUFFIX
+	source = [st.st_mtime_ns, st.st_size] if st is not None else None
+	if source is not None:
+		try:
+			with open(sidecar, "rb") as f:
+				cached = json.loads(f.read())
+			if isinstance(cached, dict) and cached.get("source") == source:
+				return cached["data"]
+		except (OSError, ValueError, KeyError):
+			pass
+	# Binary stream: libyaml detects the encoding and scans the bytes directly,
+	# skipping Python's text decoding layer
+	with open(path, "rb") as f:
+		data = yaml.load(f, Loader=SafeLoader) or {}
+	if source is not None:
+		write_json_cache(sidecar, {"source": source, "data": data})
+	return data
+
+
+def write_json_cache(sidecar: str, data) -> None:
+	"""Best-effort atomic JSON cache of parsed data; skipped if JSON cannot represent it."""
+	try:
+		encoded = json.dumps(data)
+		# Dates, non-string keys, etc. do not survive JSON; keep those YAML-only
+		if json.loads(encoded) != data:
+			return
+		# Write then rename so concurrent readers never see a partial sidecar
+		tmp_path = f"{sidecar}.{os.getpid()}.tmp"
+		try:
+			with open(tmp_path, "w") as f:
+				f.write(encoded)
+			os.replace(tmp_path, sidecar)
+		except OSError:
+			try:
+				os.remove(tmp_path)
+			except OSError:
+				pass
+			raise
+	except (OSError, TypeError, ValueError) as e:
+		logger.debug("Not writing YAML cache sidecar %s: %s", sidecar, e)
+
 
+def read_yaml_cached(path: str, st: Optional[os.stat_result] = None):
+	"""Read a YAML file, reusing the parsed result while its mtime and size are unchanged.
 
+	Callers that already hold a stat result for path (e.g. from os.scandir) may pass
+	it as st to skip the stat here. Returns a deep copy so callers may mutate the
+	result freely. Falls back to an uncached read if the file cannot be stat()ed.
+	"""
+	if st is None:
+		try:
+			st = os.stat(path)
+		except OSError:
+			return read_yaml(path)
+	with _yaml_cache_lock:
+		entry = _yaml_cache.get(path)
+		if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+			_yaml_cache.move_to_end(path)
+			return copy.deepcopy(entry[2])
+	data = read_yaml(path, st)
+	with _yaml_cache_lock:
+		_yaml_cache[path] = (st.st_mtime_ns, st.st_size, data)
+		_yaml_cache.move_to_end(path)
+		if len(_yaml_cache) > _YAML_CACHE_MAX:
+			_yaml_cache.popitem(last=False)
+	return copy.deepcopy(data)
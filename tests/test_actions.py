@@ -1,8 +1,9 @@
+import os
 import pytest
 from unittest.mock import MagicMock, patch, mock_open, ANY
 import yaml
 import uuid
-from jobsherpa.agent.actions import RunJobAction
+from jobsherpa.agent.actions import RunJobAction, _get_jinja_env
 from jobsherpa.agent.workspace_manager import JobWorkspace
 from jobsherpa.agent.actions import QueryHistoryAction
 from jobsherpa.config import UserConfig, UserConfigDefaults
@@ -98,8 +99,6 @@ launcher: ibrun
         job_dir=job_dir, output_dir=job_dir / "output", slurm_dir=job_dir / "slurm", script_path=job_dir / "job_script.sh"
     )
     mock_template = MagicMock()
-    # Render a script capturing the launcher line via a minimal template
-    mock_template.render.return_value = "#!/bin/bash\n{{ launcher or 'srun' }} app\n"
 
     run_job_action.recipe_index.find_best.return_value = MOCK_RECIPE
     run_job_action.workspace_manager.create_job_workspace.return_value = mock_job_workspace
@@ -112,7 +111,7 @@ launcher: ibrun
         result = run_job_action.run("prompt", context={"system": "mock_slurm", "workspace": str(tmp_path)})
 
     # Assert the template context contains launcher from site precedence
-    context = mock_template.render.call_args.args[0]
+    context = mock_template.stream.call_args.args[0]
     assert context.get("launcher") == "ibrun"
 
 
@@ -128,7 +127,6 @@ def test_system_config_not_mutated_by_scheduler_mapping(run_job_action, tmp_path
         job_dir=job_dir, output_dir=job_dir / "output", slurm_dir=job_dir / "slurm", script_path=job_dir / "job_script.sh"
     )
     mock_template = MagicMock()
-    mock_template.render.return_value = "script content"
 
     run_job_action.recipe_index.find_best.return_value = MOCK_RECIPE
     run_job_action.workspace_manager.create_job_workspace.return_value = mock_job_workspace
@@ -158,7 +156,6 @@ def test_scheduler_kb_missing_uses_defaults(run_job_action, tmp_path, mocker):
         job_dir=job_dir, output_dir=job_dir / "output", slurm_dir=job_dir / "slurm", script_path=job_dir / "job_script.sh"
     )
     mock_template = MagicMock()
-    mock_template.render.return_value = "script content"
 
     run_job_action.recipe_index.find_best.return_value = MOCK_RECIPE
     run_job_action.workspace_manager.create_job_workspace.return_value = mock_job_workspace
@@ -191,7 +188,6 @@ def test_run_job_action_renders_and_executes_template(run_job_action, tmp_path):
         job_dir=job_dir, output_dir=job_dir / "output", slurm_dir=job_dir / "slurm", script_path=job_dir / "job_script.sh"
     )
     mock_template = MagicMock()
-    mock_template.render.return_value = "script content"
 
     run_job_action.recipe_index.find_best.return_value = MOCK_RECIPE
     run_job_action.workspace_manager.create_job_workspace.return_value = mock_job_workspace
@@ -209,15 +205,15 @@ def test_run_job_action_renders_and_executes_template(run_job_action, tmp_path):
     run_job_action.workspace_manager.create_job_workspace.assert_called_once()
     
     # Assert template was rendered with correct context
-    mock_template.render.assert_called_once()
-    context = mock_template.render.call_args.args[0]
+    mock_template.stream.assert_called_once()
+    context = mock_template.stream.call_args.args[0]
     assert context['partition'] == 'development'
     assert context['allocation'] == 'test-alloc'
     assert context['job_dir'] == str(mock_job_workspace.job_dir)
     
     # Assert script was written and executed
     m_open.assert_called_with(mock_job_workspace.script_path, 'w')
-    m_open().write.assert_called_with("script content")
+    mock_template.stream.return_value.dump.assert_called_once_with(m_open())
     run_job_action.tool_executor.execute.assert_called_with(
         "sbatch", [mock_job_workspace.script_path.name], workspace=str(job_dir)
     )
@@ -290,7 +286,6 @@ def test_run_job_action_handles_job_submission_failure(run_job_action, tmp_path)
         job_dir=job_dir, output_dir=job_dir / "output", slurm_dir=job_dir / "slurm", script_path=job_dir / "job_script.sh"
     )
     mock_template = MagicMock()
-    mock_template.render.return_value = "script content"
 
     run_job_action.recipe_index.find_best.return_value = MOCK_RECIPE
     run_job_action.workspace_manager.create_job_workspace.return_value = mock_job_workspace
@@ -372,13 +367,13 @@ def test_query_history_action_handles_job_not_found(query_history_action):
     """
     # 1. Setup
     mock_history = query_history_action.job_history
-    mock_history.get_job_by_id.return_value = None
+    mock_history.get_full_summary.return_value = None
 
     # 2. Act
     response = query_history_action.run("tell me about job 99999")
 
     # 3. Assert
-    query_history_action.job_history.get_job_by_id.assert_called_with("99999")
+    query_history_action.job_history.get_full_summary.assert_called_with("99999")
     assert "Sorry, I couldn't find any information for job ID 99999." in response
 
 def test_query_history_action_handles_running_job(query_history_action):
@@ -387,14 +382,13 @@ def test_query_history_action_handles_running_job(query_history_action):
     """
     # 1. Setup
     mock_history = query_history_action.job_history
-    mock_history.get_job_by_id.return_value = {"result": None}
-    mock_history.check_job_status.return_value = "RUNNING"
+    mock_history.get_full_summary.return_value = {"info": {"result": None}, "status": "RUNNING", "result": None}
 
     # 2. Act
     response = query_history_action.run("what is the result of job 12345")
 
     # 3. Assert
-    query_history_action.job_history.get_job_by_id.assert_called_with("12345")
+    query_history_action.job_history.get_full_summary.assert_called_with("12345")
     assert "Job 12345 status is RUNNING" in response
 
 def test_run_job_action_renders_output_parser_file(run_job_action, tmp_path):
@@ -409,7 +403,6 @@ def test_run_job_action_renders_output_parser_file(run_job_action, tmp_path):
         job_dir=job_dir, output_dir=job_dir / "output", slurm_dir=job_dir / "slurm", script_path=job_dir / "job_script.sh"
     )
     mock_template = MagicMock()
-    mock_template.render.return_value = "script content"
 
     run_job_action.recipe_index.find_best.return_value = MOCK_RECIPE_WITH_TEMPLATE_IN_PARSER
     run_job_action.workspace_manager.create_job_workspace.return_value = mock_job_workspace
@@ -485,3 +478,56 @@ def test_query_history_action_routes_to_id_query(query_history_action):
     query_history_action._get_job_by_id_summary = MagicMock(return_value="Summary for job 12345")
     query_history_action.run("what is the status of job 12345")
     query_history_action._get_job_by_id_summary.assert_called_once_with("12345")
+
+def test_parse_job_id_from_verbose_output(run_job_action):
+    """
+    Tests that the job ID is found after arbitrary preceding output and
+    that a prefix without a following token yields None.
+    """
+    output = "sbatch: loading modules\n" * 50 + "Submitted batch job 987654\nsbatch: done\n"
+    assert run_job_action._parse_job_id(output) == "987654"
+    assert run_job_action._parse_job_id("Submitted batch job \n") is None
+    assert run_job_action._parse_job_id("sbatch: error: invalid partition") is None
+
+def test_run_job_action_defers_kb_indexing_until_used(mocker, tmp_path):
+    """
+    Tests that constructing RunJobAction does not scan the knowledge base;
+    the dataset and system indexes are built on first access.
+    """
+    dataset_index_spy = mocker.patch("jobsherpa.agent.actions.DatasetIndex")
+    system_index_spy = mocker.patch("jobsherpa.agent.actions.SystemIndex")
+    action = RunJobAction(
+        job_history=MagicMock(),
+        workspace_manager=MagicMock(),
+        tool_executor=MagicMock(),
+        knowledge_base_dir=str(tmp_path),
+        user_config=UserConfig(defaults=UserConfigDefaults(workspace=str(tmp_path), system="mock_slurm")),
+        system_config=MOCK_SYSTEM_CONFIG.copy(),
+    )
+    dataset_index_spy.assert_not_called()
+    system_index_spy.assert_not_called()
+
+    assert action.system_index is action.system_index
+    system_index_spy.assert_called_once_with(base_dir=str(tmp_path))
+    system_index_spy.return_value.index.assert_called_once()
+
+
+def test_jinja_env_is_per_tools_dir_and_reloads_edits(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    first_dir, second_dir = tmp_path / "a", tmp_path / "b"
+    for tools_dir, text in ((first_dir, "a1"), (second_dir, "b1")):
+        tools_dir.mkdir()
+        (tools_dir / "t.j2").write_text(text)
+
+    first = _get_jinja_env(str(first_dir))
+    # The bytecode cache directory is only created once a template compiles
+    assert not (tmp_path / "cache").exists()
+    assert first.get_template("t.j2").render() == "a1"
+    assert (tmp_path / "cache" / "jobsherpa" / "jinja").is_dir()
+    assert _get_jinja_env(str(second_dir)).get_template("t.j2").render() == "b1"
+    assert _get_jinja_env(str(first_dir)) is first
+
+    # An edited template is recompiled rather than served from the cache
+    (first_dir / "t.j2").write_text("a2")
+    os.utime(first_dir / "t.j2", (0, os.path.getmtime(first_dir / "t.j2") + 10))
+    assert first.get_template("t.j2").render() == "a2"
@@ -124,6 +124,18 @@ def test_config_manager_rejects_invalid_config(config_file):
     with pytest.raises(ValidationError):
         manager.load()
 
+def test_config_manager_keeps_raw_data_when_validation_fails(config_file):
+    """
+    Tests that the parsed file stays available after a failed load so the
+    agent's lenient fallback does not have to parse it again.
+    """
+    config_file.write_text(INVALID_YAML_CONTENT)
+    manager = ConfigManager(config_path=str(config_file))
+
+    with pytest.raises(ValidationError):
+        manager.load()
+    assert manager.raw_data["defaults"]["system"] == "vista"
+
 def test_config_manager_saves_and_preserves_comments(config_file):
     """
     Tests that the ConfigManager can save a modified config object
@@ -142,3 +154,60 @@ def test_config_manager_saves_and_preserves_comments(config_file):
     assert "# My user settings" in new_content
     assert "# My main workspace" in new_content
     assert "allocation: NEW-ALLOC" in new_content
+
+def test_config_manager_load_is_cached_until_file_changes(config_file, monkeypatch):
+    """
+    Tests that an unchanged file is served from the load cache as an
+    independent copy, and that save() invalidates the cached entry.
+    """
+    config_file.write_text(VALID_YAML_CONTENT)
+    manager = ConfigManager(config_path=str(config_file))
+    first = manager.load()
+    first.defaults.allocation = "MUTATED"
+
+    second_manager = ConfigManager(config_path=str(config_file))
+    def fail_load(*args, **kwargs):
+        raise AssertionError("YAML should not be parsed on a cache hit")
+    monkeypatch.setattr(cm, "YAML", fail_load)
+    second = second_manager.load()
+    assert second.defaults.allocation != "MUTATED"
+    monkeypatch.undo()
+
+    second.defaults.allocation = "NEW-ALLOC"
+    manager.save(second)
+    assert ConfigManager(config_path=str(config_file)).load().defaults.allocation == "NEW-ALLOC"
+
+def test_config_manager_consecutive_saves_reuse_document(config_file, monkeypatch):
+    """
+    Tests that a second save() on an unchanged file reuses the document from
+    the first instead of re-parsing it, and still preserves comments.
+    """
+    config_file.write_text(VALID_YAML_CONTENT)
+    config = ConfigManager(config_path=str(config_file)).load()
+    config.defaults.allocation = "FIRST"
+    ConfigManager(config_path=str(config_file)).save(config)
+
+    manager = ConfigManager(config_path=str(config_file))
+    def fail_load(*args, **kwargs):
+        raise AssertionError("file should not be re-parsed for save")
+    monkeypatch.setattr(manager.yaml, "load", fail_load)
+    config.defaults.allocation = "SECOND"
+    manager.save(config)
+
+    new_content = config_file.read_text()
+    assert "# My user settings" in new_content
+    assert "allocation: SECOND" in new_content
+
+def test_config_manager_round_trips_yaml_1_1_lookalike_values(config_file):
+    """
+    Tests that values YAML 1.1 would read as booleans or octal ints stay
+    strings through load() and survive a save() and reload.
+    """
+    config_file.write_text("defaults:\n  workspace: /w\n  system: vista\n  allocation: no\n")
+    config = ConfigManager(config_path=str(config_file)).load()
+    assert config.defaults.allocation == "no"
+
+    for value in ("on", "no", "0755"):
+        config.defaults.allocation = value
+        ConfigManager(config_path=str(config_file)).save(config)
+        assert ConfigManager(config_path=str(config_file)).load().defaults.allocation == value
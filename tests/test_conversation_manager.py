@@ -155,3 +155,61 @@ def test_conversation_manager_offers_to_save_multiple_parameters(mocker):
     assert mock_user_config.defaults.partition == "use-this-partition"
     assert "Configuration saved!" in response
     assert is_waiting is False
+
+def test_conversation_manager_saves_only_selected_keys(mocker):
+    """
+    Tests that a comma/space separated save selection persists only the
+    named keys and ignores unknown ones.
+    """
+    mock_run_job_action = MagicMock()
+    mock_config_manager_class = mocker.patch("jobsherpa.agent.conversation_manager.ConfigManager")
+    mock_user_config = MagicMock()
+    mock_user_config.defaults.allocation = None
+    mock_user_config.defaults.partition = None
+    mock_config_manager_class.return_value.load.return_value = mock_user_config
+
+    manager = ConversationManager(
+        intent_classifier=MagicMock(),
+        run_job_action=mock_run_job_action,
+        query_history_action=MagicMock(),
+        user_profile_path="/fake/path/user.yaml",
+    )
+    mock_run_job_action.run.return_value = ActionResult(message="I need an allocation.", is_waiting=True, param_needed="allocation")
+    manager.handle_prompt("Run my job")
+    mock_run_job_action.run.return_value = ActionResult(message="I need a partition.", is_waiting=True, param_needed="partition")
+    manager.handle_prompt("use-this-alloc")
+    mock_run_job_action.run.return_value = ActionResult(message="Job submitted with ID: 12345", job_id="12345", is_waiting=False)
+    manager.handle_prompt("use-this-partition")
+
+    response, _, is_waiting = manager.handle_prompt(" partition,  bogus ")
+    assert "Configuration saved!" in response
+    assert mock_user_config.defaults.partition == "use-this-partition"
+    assert mock_user_config.defaults.allocation is None
+    assert is_waiting is False
+
+def test_conversation_manager_uses_slots():
+    """ConversationManager keeps its fixed state in slots, without a per-instance dict."""
+    manager = ConversationManager(MagicMock(), MagicMock(), MagicMock())
+    assert not hasattr(manager, "__dict__")
+    with pytest.raises(AttributeError):
+        manager.unexpected = True
+
+def test_conversation_manager_reuses_config_manager_across_saves(mocker):
+    """The profile's ConfigManager is created once per conversation manager and reused."""
+    mock_config_manager_class = mocker.patch("jobsherpa.agent.conversation_manager.ConfigManager")
+    mock_run_job_action = MagicMock()
+    manager = ConversationManager(
+        intent_classifier=MagicMock(),
+        run_job_action=mock_run_job_action,
+        query_history_action=MagicMock(),
+        user_profile_path="/fake/path/user.yaml",
+    )
+    for _ in range(2):
+        mock_run_job_action.run.return_value = ActionResult(message="I need an allocation.", is_waiting=True, param_needed="allocation")
+        manager.handle_prompt("Run my job")
+        mock_run_job_action.run.return_value = ActionResult(message="Job submitted with ID: 12345", job_id="12345", is_waiting=False)
+        manager.handle_prompt("use-this-alloc")
+        assert manager.handle_prompt("all")[0] == "Configuration saved!"
+
+    mock_config_manager_class.assert_called_once_with(config_path="/fake/path/user.yaml")
+    assert mock_config_manager_class.return_value.save.call_count == 2
@@ -0,0 +1,74 @@
+import json
+import os
+
+from jobsherpa.util.io import read_yaml, read_yaml_cached, SIDECAR_SUFFIX
+
+
+def test_read_yaml_writes_and_reuses_json_sidecar(tmp_path):
+    path = tmp_path / "system.yaml"
+    path.write_text("name: vista\nscheduler: slurm\n")
+
+    assert read_yaml(str(path)) == {"name": "vista", "scheduler": "slurm"}
+    sidecar = tmp_path / ("system.yaml" + SIDECAR_SUFFIX)
+    assert sidecar.is_file()
+    # The sidecar is written via a temp file and rename; nothing else is left behind
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["system.yaml", "system.yaml" + SIDECAR_SUFFIX]
+
+    # A sidecar matching the YAML's mtime and size is served instead of re-parsing
+    st = path.stat()
+    sidecar.write_text(json.dumps({"source": [st.st_mtime_ns, st.st_size], "data": {"name": "from-sidecar"}}))
+    assert read_yaml(str(path)) == {"name": "from-sidecar"}
+
+
+def test_read_yaml_ignores_stale_sidecar(tmp_path):
+    path = tmp_path / "system.yaml"
+    sidecar = tmp_path / ("system.yaml" + SIDECAR_SUFFIX)
+    sidecar.write_text('{"name": "stale"}')
+    path.write_text("name: fresh\n")
+    os.utime(sidecar, ns=(0, 0))
+
+    assert read_yaml(str(path)) == {"name": "fresh"}
+
+
+def test_read_yaml_picks_up_replacement_with_older_mtime(tmp_path):
+    path = tmp_path / "system.yaml"
+    path.write_text("name: vista\n")
+    assert read_yaml(str(path)) == {"name": "vista"}
+    assert read_yaml_cached(str(path)) == {"name": "vista"}
+
+    # Restored from a backup (cp -p, rsync -t, tar x): same size, older mtime
+    path.write_text("name: stamp\n")
+    os.utime(path, ns=(0, 0))
+    assert read_yaml(str(path)) == {"name": "stamp"}
+    assert read_yaml_cached(str(path)) == {"name": "stamp"}
+
+
+def test_read_yaml_skips_sidecar_for_non_json_data(tmp_path):
+    path = tmp_path / "dates.yaml"
+    path.write_text("when: 2024-01-01\n")
+
+    data = read_yaml(str(path))
+    assert str(data["when"]) == "2024-01-01"
+    assert not (tmp_path / ("dates.yaml" + SIDECAR_SUFFIX)).exists()
+
+
+def test_read_yaml_cached_returns_independent_copies(tmp_path):
+    path = tmp_path / "system.yaml"
+    path.write_text("name: vista\nmodules: [gcc]\n")
+
+    first = read_yaml_cached(str(path))
+    first["modules"].append("mpi")
+    assert read_yaml_cached(str(path)) == {"name": "vista", "modules": ["gcc"]}
+
+    # A rewrite that changes the file size invalidates the cached parse
+    path.write_text("name: frontera\nmodules: [gcc]\n")
+    assert read_yaml_cached(str(path))["name"] == "frontera"
+
+
+def test_read_yaml_decodes_utf8_with_bom(tmp_path):
+    path = tmp_path / "site.yaml"
+    path.write_bytes("﻿name: café\n".encode("utf-8"))
+
+    assert read_yaml(str(path)) == {"name": "café"}
+    # Second read is served from the JSON sidecar and must decode identically
+    assert read_yaml(str(path)) == {"name": "café"}
@@ -1,3 +1,4 @@
+import os
 import pytest
 from unittest.mock import MagicMock, patch
 from freezegun import freeze_time
@@ -59,6 +60,22 @@ def test_history_persists_to_file(tmp_path):
     # 3. Assert that the second instance has loaded the state of the first.
     assert history2.get_status(job_id) == "PENDING"
 
+def test_history_picks_up_external_writes_without_reparsing(tmp_path, mocker):
+    """
+    Tests that a JobHistory reloads the file only when another writer has
+    changed it, and otherwise serves lookups from memory.
+    """
+    history_file = tmp_path / "history.json"
+    reader = JobHistory(history_file_path=str(history_file), scheduler_client=MockScheduler())
+    writer = JobHistory(history_file_path=str(history_file), scheduler_client=MockScheduler())
+    writer.register_job("mock_1", job_name="test_job", job_directory="/tmp/mock_dir")
+
+    load_spy = mocker.spy(reader, "_load_state")
+    assert reader.get_job_by_id("mock_1")["job_name"] == "test_job"
+    assert reader.get_latest_job_id() == "mock_1"
+    assert reader.get_result("mock_1") is None
+    assert load_spy.call_count == 1
+
 def test_get_status_actively_checks_squeue(job_history):
     """
     Tests that calling get_status on a PENDING job triggers a call
@@ -161,3 +178,320 @@ def test_parse_job_output_handles_missing_file(job_history, tmp_path):
     
     assert job_history.get_result(job_id) is None
     assert job_history.get_status(job_id) == "COMPLETED"
+
+def test_status_cycle_saves_history_once(tmp_path):
+    """
+    Tests that a polling cycle covering several jobs persists them in one
+    write, and writes nothing when no status changed.
+    """
+    history = JobHistory(history_file_path=str(tmp_path / "history.json"), scheduler_client=MockScheduler())
+    for job_id in ("1", "2", "3"):
+        history.register_job(job_id, job_name="job", job_directory="/tmp/mock_dir")
+    history.scheduler_client = MockScheduler(active={"1": "RUNNING", "2": "RUNNING"}, final={"3": "FAILED"})
+
+    with patch.object(history, "_record_changes", wraps=history._record_changes) as record:
+        history.check_and_update_statuses()
+        record.assert_called_once_with(["1", "2", "3"])
+        history.check_and_update_statuses(specific_job_id="1")
+        record.assert_called_with([])
+    history.scheduler_client = MagicMock(wraps=MockScheduler())
+    history.check_and_update_statuses(specific_job_id="3")
+    history.scheduler_client.get_active_statuses.assert_called_once_with(["3", "1", "2"])
+    assert history.get_job_by_id("3")["status"] == "FAILED"
+
+def test_check_and_update_statuses_skips_idle_history(tmp_path):
+    """
+    Tests that a polling cycle with no active jobs makes no scheduler call,
+    and that jobs loaded from disk in an active state are still polled.
+    """
+    history_path = str(tmp_path / "history.json")
+    history = JobHistory(history_file_path=history_path, scheduler_client=MockScheduler())
+    history.register_job("1", job_name="job", job_directory="/tmp/mock_dir")
+    history.register_job("2", job_name="job", job_directory="/tmp/mock_dir")
+    history.set_status("2", "COMPLETED")
+
+    reloaded = JobHistory(history_file_path=history_path, scheduler_client=MagicMock(wraps=MockScheduler()))
+    reloaded.check_and_update_statuses()
+    reloaded.scheduler_client.get_active_statuses.assert_called_once_with(["1"])
+
+    reloaded.set_status("1", "FAILED")
+    reloaded.scheduler_client.reset_mock()
+    reloaded.check_and_update_statuses()
+    reloaded.scheduler_client.get_active_statuses.assert_not_called()
+
+def test_history_journals_updates_and_compacts(tmp_path, monkeypatch):
+    """
+    Tests that status changes are appended to the journal instead of
+    rewriting the snapshot, that a reload replays them (skipping a torn
+    final line), and that a full journal is folded into a new snapshot.
+    """
+    import jobsherpa.agent.job_history as job_history_module
+
+    history_file = tmp_path / "history.json"
+    journal_file = tmp_path / "history.json.journal"
+    history = JobHistory(history_file_path=str(history_file), scheduler_client=MockScheduler())
+    history.register_job("1", job_name="job", job_directory="/tmp/mock_dir")
+    snapshot = history_file.read_bytes()
+    assert not journal_file.exists()
+
+    history.set_status("1", "RUNNING")
+    history.register_job("2", job_name="job", job_directory="/tmp/mock_dir")
+    assert history_file.read_bytes() == snapshot
+    assert len(journal_file.read_bytes().splitlines()) == 2
+
+    with open(journal_file, "ab") as f:
+        f.write(b'{"job_id": "3", "sta')
+    reloaded = JobHistory(history_file_path=str(history_file), scheduler_client=MockScheduler())
+    assert set(reloaded.get_all_jobs()) == {"1", "2"}
+    assert reloaded.get_job_by_id("1")["status"] == "RUNNING"
+    reloaded.set_status("1", "COMPLETED")
+    assert not journal_file.exists()
+    assert JobHistory(history_file_path=str(history_file)).get_job_by_id("1")["status"] == "COMPLETED"
+
+    reloaded.set_status("1", "RUNNING")
+    # With two jobs the journal may hold four records before compaction
+    monkeypatch.setattr(job_history_module, "_JOURNAL_COMPACT_AT", 2)
+    reloaded.set_status("1", "PENDING")
+    reloaded.set_status("1", "RUNNING")
+    assert len(journal_file.read_bytes().splitlines()) == 3
+    reloaded.set_status("2", "FAILED")
+    assert not journal_file.exists()
+    fresh = JobHistory(history_file_path=str(history_file), scheduler_client=MockScheduler())
+    assert fresh.get_job_by_id("2")["status"] == "FAILED"
+
+def test_history_snapshot_is_replaced_atomically(tmp_path, monkeypatch):
+    """
+    Tests that a failed snapshot write leaves the previous history intact and
+    no temporary files behind.
+    """
+    history_file = tmp_path / "history.json"
+    history = JobHistory(history_file_path=str(history_file), scheduler_client=MockScheduler())
+    history.register_job("1", job_name="job", job_directory="/tmp/mock_dir")
+    before = history_file.read_bytes()
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+    monkeypatch.setattr("jobsherpa.agent.job_history.os.replace", fail_replace)
+    history.register_job("2", job_name="job", job_directory="/tmp/mock_dir")
+    history._save_state()
+
+    assert history_file.read_bytes() == before
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["history.json", "history.json.journal"]
+
+@pytest.mark.parametrize("failure", [KeyboardInterrupt, PermissionError])
+def test_history_ignores_journal_left_behind_by_a_snapshot(tmp_path, monkeypatch, failure):
+    """
+    Tests that a journal surviving the snapshot that superseded it (a crash,
+    or a failed removal, right after the snapshot is replaced) is not
+    replayed over the newer snapshot, and that later updates still persist.
+    """
+    import jobsherpa.agent.job_history as job_history_module
+
+    history_file = str(tmp_path / "history.json")
+    journal_file = tmp_path / "history.json.journal"
+    history = JobHistory(history_file_path=history_file, scheduler_client=MockScheduler())
+    history.register_job("1", job_name="job", job_directory="/tmp/mock_dir")
+    history.set_status("1", "RUNNING")
+    assert journal_file.exists()
+
+    real_remove = os.remove
+    def fail_remove(path):
+        if path == str(journal_file):
+            raise failure("journal removal failed")
+        real_remove(path)
+    monkeypatch.setattr(job_history_module, "_JOURNAL_COMPACT_AT", 1)
+    monkeypatch.setattr("jobsherpa.agent.job_history.os.remove", fail_remove)
+    try:
+        history.set_status("1", "COMPLETED")
+    except KeyboardInterrupt:
+        pass
+    assert journal_file.exists()
+    assert JobHistory(history_file_path=history_file).get_job_by_id("1")["status"] == "COMPLETED"
+
+    monkeypatch.undo()
+    reloaded = JobHistory(history_file_path=history_file, scheduler_client=MockScheduler())
+    reloaded.register_job("2", job_name="job", job_directory="/tmp/mock_dir")
+    reloaded.set_status("2", "RUNNING")
+    fresh = JobHistory(history_file_path=history_file)
+    assert fresh.get_job_by_id("1")["status"] == "COMPLETED"
+    assert fresh.get_job_by_id("2")["status"] == "RUNNING"
+
+def test_latest_job_id_tracks_registrations_and_reloads(tmp_path):
+    """
+    Tests that the latest job follows new registrations without a scan and
+    is rebuilt from disk when another writer adds a newer job.
+    """
+    history_file = str(tmp_path / "history.json")
+    history = JobHistory(history_file_path=history_file, scheduler_client=MockScheduler())
+    assert history.get_latest_job_id() is None
+    with freeze_time("2025-08-14 12:00:00"):
+        history.register_job("older", job_name="job", job_directory="/tmp/mock_dir")
+    with freeze_time("2025-08-14 12:05:00"):
+        history.register_job("newer", job_name="job", job_directory="/tmp/mock_dir")
+    with freeze_time("2025-08-14 11:00:00"):
+        history.register_job("backdated", job_name="job", job_directory="/tmp/mock_dir")
+    assert history.get_latest_job_id() == "newer"
+
+    writer = JobHistory(history_file_path=history_file, scheduler_client=MockScheduler())
+    with freeze_time("2025-08-14 13:00:00"):
+        writer.register_job("external", job_name="job", job_directory="/tmp/mock_dir")
+    assert history.get_latest_job_id() == "external"
+
+def test_history_parses_empty_and_non_ascii_output(job_history, tmp_path):
+    """
+    Tests that an empty output file yields no result without error, and that
+    results are decoded from UTF-8 output.
+    """
+    output_file = tmp_path / "results.txt"
+    output_file.write_bytes(b"")
+    output_parser_info = {"file": "results.txt", "parser_regex": r"Site: (\S+)"}
+    job_history.register_job("1", job_name="test_job", job_directory=str(tmp_path), output_parser_info=output_parser_info)
+    job_history.set_status("1", "COMPLETED")
+    assert job_history.get_result("1") is None
+
+    output_file.write_text("Grüße\nSite: Zürich\n", encoding="utf-8")
+    assert job_history.try_parse_result("1") == "Zürich"
+
+def test_history_parser_keeps_unicode_regex_semantics(job_history, tmp_path):
+    """
+    Tests that \\w and (?i) in a parser regex match non-ASCII characters,
+    as with str patterns, for ordinary-sized output files.
+    """
+    (tmp_path / "results.txt").write_text("Site: Zürich\n", encoding="utf-8")
+    job_history.register_job("1", job_name="test_job", job_directory=str(tmp_path),
+                             output_parser_info={"file": "results.txt", "parser_regex": r"Site: (\w+)"})
+    job_history.register_job("2", job_name="test_job", job_directory=str(tmp_path),
+                             output_parser_info={"file": "results.txt", "parser_regex": r"(?i)site: (ZÜRICH)"})
+    assert job_history.try_parse_result("1") == "Zürich"
+    assert job_history.try_parse_result("2") == "Zürich"
+
+def test_register_job_warns_about_invalid_parser_regex(job_history, caplog):
+    """
+    Tests that an unparsable output-parser pattern is reported when the job
+    is registered, without failing the registration.
+    """
+    output_parser_info = {"file": "out.txt", "parser_regex": r"value: (\d+"}
+    with caplog.at_level("WARNING", logger="jobsherpa.agent.job_history"):
+        job_history.register_job("1", job_name="test_job", job_directory="/tmp/mock_dir", output_parser_info=output_parser_info)
+    assert job_history.get_job_by_id("1") is not None
+    assert "Invalid output parser regex for job 1" in caplog.text
+
+def test_history_parses_large_output_through_mmap(job_history, tmp_path):
+    """Tests that output files above the mmap threshold are parsed from the mapping."""
+    output_file = tmp_path / "results.txt"
+    with open(output_file, "wb") as f:
+        f.write(b"x" * (128 * 1024) + b"\nThe final value is: 42\n")
+    output_parser_info = {"file": "results.txt", "parser_regex": r"value is: ([0-9]+)"}
+    job_history.register_job("1", job_name="test_job", job_directory=str(tmp_path), output_parser_info=output_parser_info)
+    with patch("jobsherpa.agent.job_history.mmap.mmap", wraps=__import__("mmap").mmap) as mapped:
+        job_history.set_status("1", "COMPLETED")
+    assert mapped.called
+    assert job_history.get_result("1") == "42"
+
+def test_history_parses_large_output_like_small_output(job_history, tmp_path):
+    """
+    Tests that patterns whose bytes form would match differently (Unicode
+    classes, non-ASCII literals, unicode escapes) give the same result on a
+    large output file as on a small one.
+    """
+    output_file = tmp_path / "results.txt"
+    output_file.write_bytes(b"x" * (128 * 1024) + "\nSite: Zürich\n".encode("utf-8"))
+    patterns = {
+        r"Site: (\w+)": "Zürich",
+        r"Site: Zü(\w+)": "rich",
+        r"Site: (Z\u00fcrich)": "Zürich",
+        r"(?i)site: (ZÜRICH)": "Zürich",
+        r"Site: (.+)": "Zürich",
+    }
+    for n, (pattern, expected) in enumerate(patterns.items()):
+        job_history.register_job(str(n), job_name="test_job", job_directory=str(tmp_path),
+                                 output_parser_info={"file": "results.txt", "parser_regex": pattern})
+        assert job_history.try_parse_result(str(n)) == expected, pattern
+
+def test_concurrent_registrations_are_all_persisted(tmp_path):
+    """
+    Tests that jobs registered and updated from several threads at once are
+    all recorded in memory and on disk.
+    """
+    import threading
+
+    history_file = str(tmp_path / "history.json")
+    history = JobHistory(history_file_path=history_file, scheduler_client=MockScheduler())
+
+    def worker(n):
+        for i in range(25):
+            job_id = f"{n}-{i}"
+            history.register_job(job_id, job_name="job", job_directory="/tmp/mock_dir")
+            history.set_status(job_id, "RUNNING")
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(history.get_all_jobs()) == 200
+    reloaded = JobHistory(history_file_path=history_file, scheduler_client=MockScheduler())
+    jobs = reloaded.get_all_jobs()
+    assert len(jobs) == 200
+    assert all(job["status"] == "RUNNING" for job in jobs.values())
+
+def test_get_all_jobs_is_read_only_live_view(tmp_path):
+    """get_all_jobs returns a read-only view that reflects later changes."""
+    history = JobHistory(history_file_path=str(tmp_path / "history.json"))
+    jobs = history.get_all_jobs()
+    history.register_job("1", job_name="a", job_directory="/tmp/a")
+    assert "1" in jobs
+    with pytest.raises(TypeError):
+        jobs["2"] = {}
+
+def test_get_all_jobs_view_stays_live_across_reloads(tmp_path):
+    """The view from get_all_jobs follows reloads caused by another writer."""
+    history_file = str(tmp_path / "history.json")
+    reader = JobHistory(history_file_path=history_file, scheduler_client=MockScheduler())
+    jobs = reader.get_all_jobs()
+    JobHistory(history_file_path=history_file, scheduler_client=MockScheduler()).register_job(
+        "1", job_name="a", job_directory="/tmp/a")
+    reader.register_job("2", job_name="b", job_directory="/tmp/b")
+    assert set(jobs) == {"1", "2"}
+
+def test_set_status_unchanged_writes_nothing(tmp_path):
+    """Re-setting a job's current status leaves the history files untouched."""
+    history_file = tmp_path / "history.json"
+    journal_file = tmp_path / "history.json.journal"
+    history = JobHistory(history_file_path=str(history_file), scheduler_client=MockScheduler())
+    history.register_job("1", job_name="job", job_directory="/tmp/mock_dir")
+    history.set_status("1", "RUNNING")
+    journal = journal_file.read_bytes()
+    history.set_status("1", "RUNNING")
+    assert journal_file.read_bytes() == journal
+
+    # A completed job with a parsed result is not re-parsed or re-written
+    job_dir = tmp_path / "job"
+    job_dir.mkdir()
+    (job_dir / "out.txt").write_text("value=7\n")
+    history.register_job("2", job_name="job", job_directory=str(job_dir),
+                         output_parser_info={"file": "out.txt", "parser_regex": r"value=(\d+)"})
+    history.set_status("2", "COMPLETED")
+    assert history.get_result("2") == "7"
+    journal = journal_file.read_bytes()
+    history.set_status("2", "COMPLETED")
+    assert journal_file.read_bytes() == journal
+
+def test_history_recreates_removed_directory(tmp_path):
+    """Tests that history writes recreate the history directory if it was removed."""
+    import shutil
+
+    history_dir = tmp_path / ".jobsherpa"
+    history_dir.mkdir()
+    history_file = history_dir / "history.json"
+    history = JobHistory(history_file_path=str(history_file), scheduler_client=MockScheduler())
+    history.register_job("1", job_name="job", job_directory="/tmp/mock_dir")
+
+    shutil.rmtree(history_dir)
+    history.set_status("1", "RUNNING")
+    assert JobHistory(history_file_path=str(history_file)).get_job_by_id("1")["status"] == "RUNNING"
+
+    shutil.rmtree(history_dir)
+    JobHistory(history_file_path=str(history_file)).register_job("2", job_name="job", job_directory="/tmp/mock_dir")
+    assert history_file.is_file()
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -44,3 +45,140 @@ def test_parse_skips_when_parser_info_missing(tmp_path):
     assert history.try_parse_result("2") is None
 
 
+def test_refresh_statuses_batches_and_caches_scheduler_queries():
+    scheduler = MagicMock()
+    scheduler.get_active_statuses.return_value = {"1": "RUNNING", "2": "RUNNING"}
+    scheduler.get_final_statuses.return_value = {}
+    history = JobHistory(history_file_path=None, scheduler_client=scheduler, status_ttl=60)
+    history.register_job(job_id="1", job_name="a", job_directory="/tmp/a")
+    history.register_job(job_id="2", job_name="b", job_directory="/tmp/b")
+
+    assert history.refresh_statuses(["1", "2"]) == {"1": "RUNNING", "2": "RUNNING"}
+    # One batched squeue call covers both jobs
+    scheduler.get_active_statuses.assert_called_once_with(["1", "2"])
+
+    # Follow-up lookups within the TTL are served from memory
+    assert history.check_job_status("1") == "RUNNING"
+    assert history.get_status("2") == "RUNNING"
+    assert scheduler.get_active_statuses.call_count == 1
+
+
+def test_refresh_of_one_job_covers_other_active_jobs():
+    scheduler = MagicMock()
+    scheduler.get_active_statuses.return_value = {"1": "RUNNING", "2": "PENDING"}
+    scheduler.get_final_statuses.return_value = {"3": "COMPLETED"}
+    history = JobHistory(history_file_path=None, scheduler_client=scheduler, status_ttl=60)
+    for job_id in ("1", "2", "3"):
+        history.register_job(job_id=job_id, job_name="a", job_directory="/tmp/a")
+
+    assert history.get_status("1") == "RUNNING"
+    scheduler.get_active_statuses.assert_called_once_with(["1", "2", "3"])
+    scheduler.get_final_statuses.assert_called_once_with(["3"])
+
+    # The other jobs were refreshed by the same query
+    assert history.get_status("2") == "PENDING"
+    assert history.get_status("3") == "COMPLETED"
+    assert scheduler.get_active_statuses.call_count == 1
+
+
+def test_try_parse_result_reuses_parse_until_output_changes(tmp_path):
+    job_dir = tmp_path / "job"
+    out_dir = job_dir / "output"
+    out_dir.mkdir(parents=True)
+    out_file = out_dir / "rng.txt"
+    out_file.write_text("no value yet\n")
+
+    history = JobHistory(history_file_path=None, scheduler_client=DummyScheduler())
+    history.register_job(
+        job_id="3",
+        job_name="test",
+        job_directory=str(job_dir),
+        output_parser_info={"file": "output/rng.txt", "parser_regex": r"value is (\d+)"},
+    )
+    history.set_status("3", "FAILED")
+
+    original_parse = history._parse_job_output
+    history._parse_job_output = MagicMock(side_effect=original_parse)
+    assert history.try_parse_result("3") is None
+    assert history.try_parse_result("3") is None
+    assert history._parse_job_output.call_count == 1
+
+    # A rewritten output file (new mtime) is parsed again
+    out_file.write_text("The value is 7\n")
+    os.utime(out_file, ns=(0, 10**9))
+    assert history.try_parse_result("3") == "7"
+
+
+def test_get_full_summary_returns_info_status_and_result(tmp_path):
+    job_dir = tmp_path / "job"
+    (job_dir / "output").mkdir(parents=True)
+    (job_dir / "output" / "rng.txt").write_text("The value is 5\n")
+    scheduler = MagicMock()
+    scheduler.get_active_statuses.return_value = {}
+    scheduler.get_final_statuses.return_value = {"4": "COMPLETED"}
+
+    history = JobHistory(history_file_path=None, scheduler_client=scheduler)
+    history.register_job(
+        job_id="4",
+        job_name="test",
+        job_directory=str(job_dir),
+        output_parser_info={"file": "output/rng.txt", "parser_regex": r"value is (\d+)"},
+    )
+    summary = history.get_full_summary("4")
+    assert summary["status"] == "COMPLETED"
+    assert summary["result"] == "5"
+    assert summary["info"]["job_name"] == "test"
+    assert history.get_full_summary("missing") is None
+
+
+def test_history_round_trips_with_stdlib_json_fallback(tmp_path, monkeypatch):
+    from jobsherpa.agent import job_history as job_history_module
+
+    history_file = tmp_path / "history.json"
+    writer = JobHistory(history_file_path=str(history_file), scheduler_client=DummyScheduler())
+    writer.register_job("1", "job", str(tmp_path))
+
+    # A file written with orjson (when installed) must load with plain json and vice versa
+    monkeypatch.setattr(job_history_module, "orjson", None)
+    reader = JobHistory(history_file_path=str(history_file), scheduler_client=DummyScheduler())
+    assert reader.get_job_by_id("1")["job_name"] == "job"
+    reader.register_job("2", "other", str(tmp_path))
+
+    monkeypatch.undo()
+    assert set(JobHistory(history_file_path=str(history_file), scheduler_client=DummyScheduler()).get_all_jobs()) == {"1", "2"}
+
+
+def test_status_ttl_backs_off_for_unchanged_jobs_and_resets_on_change():
+    scheduler = MagicMock()
+    scheduler.get_active_statuses.return_value = {"1": "RUNNING"}
+    scheduler.get_final_statuses.return_value = {}
+    history = JobHistory(history_file_path=None, scheduler_client=scheduler, status_ttl=10)
+    history.register_job(job_id="1", job_name="a", job_directory="/tmp/a")
+    assert history._status_ttl_for("1") == 10
+
+    history.refresh_statuses(["1"])  # PENDING -> RUNNING
+    assert history._status_ttl_for("1") == 10
+    history.check_and_update_statuses()
+    history.check_and_update_statuses()
+    assert history._status_ttl_for("1") == 22.5
+    for _ in range(10):
+        history.check_and_update_statuses()
+    assert history._status_ttl_for("1") == 60
+
+    scheduler.get_active_statuses.return_value = {}
+    scheduler.get_final_statuses.return_value = {"1": "COMPLETED"}
+    history.check_and_update_statuses(specific_job_id="1")
+    assert history._status_ttl_for("1") == 10
+
+
+def test_refresh_statuses_skips_terminal_jobs():
+    scheduler = MagicMock()
+    history = JobHistory(history_file_path=None, scheduler_client=scheduler, status_ttl=0)
+    history.register_job(job_id="1", job_name="a", job_directory="/tmp/a")
+    history.set_status("1", "COMPLETED")
+
+    for _ in range(3):
+        assert history.refresh_statuses(["1"]) == {"1": "COMPLETED"}
+        assert history.get_status("1") == "COMPLETED"
+    scheduler.get_active_statuses.assert_not_called()
+    scheduler.get_final_statuses.assert_not_called()
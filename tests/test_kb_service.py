@@ -0,0 +1,36 @@
+from jobsherpa.kb import service as kb_service_module
+from jobsherpa.kb.service import KnowledgeBaseService, get_kb_service
+
+
+def write_system(tmp_path, body):
+    system_dir = tmp_path / "kb" / "system"
+    system_dir.mkdir(parents=True, exist_ok=True)
+    (system_dir / "vista.yaml").write_text(body)
+
+
+def test_load_system_reuses_validated_profile_until_file_changes(tmp_path, mocker):
+    write_system(tmp_path, "name: Vista\nscheduler: slurm\n")
+    service = KnowledgeBaseService(base_dir=str(tmp_path / "kb"))
+    read_spy = mocker.spy(kb_service_module, "read_yaml_cached")
+
+    first, model = service.load_system("vista")
+    first["commands"] = {"submit": "sbatch"}
+    second, cached_model = service.load_system("vista")
+    assert read_spy.call_count == 1
+    assert cached_model is model
+    # Mutating a returned dict never leaks into later loads
+    assert "commands" not in second
+
+    write_system(tmp_path, "name: Vista\nscheduler: slurm\ndescription: updated\n")
+    third, _ = service.load_system("vista")
+    assert third["description"] == "updated"
+
+    service.clear_cache()
+    service.load_system("vista")
+    assert read_spy.call_count == 3
+
+
+def test_get_kb_service_is_shared_per_base_dir(tmp_path):
+    kb_dir = str(tmp_path / "kb")
+    assert get_kb_service(kb_dir) is get_kb_service(kb_dir)
+    assert get_kb_service(str(tmp_path / "other")) is not get_kb_service(kb_dir)
@@ -1,7 +1,9 @@
 import os
 import yaml
 
-from jobsherpa.agent.recipe_index import SimpleKeywordIndex
+from jobsherpa.agent import recipe_index as recipe_index_module
+from jobsherpa.agent.recipe_index import SimpleKeywordIndex, shared_keyword_index, INDEX_CACHE_NAME
+from jobsherpa.util import io as io_util
 
 
 def write_yaml(path, data):
@@ -42,3 +44,111 @@ def test_simple_keyword_index_returns_none_when_no_match(tmp_path):
     assert match is None
 
 
+def test_simple_keyword_index_reuses_parsed_recipes_until_file_changes(tmp_path, mocker):
+    kb_dir = tmp_path / "kb"
+    apps = kb_dir / "applications"
+    apps.mkdir(parents=True)
+    write_yaml(apps / "a.yaml", {"name": "A", "keywords": ["alpha"]})
+    parse_spy = mocker.spy(io_util, "read_yaml")
+
+    first = SimpleKeywordIndex(str(kb_dir))
+    first.index()
+    second = SimpleKeywordIndex(str(kb_dir))
+    second.index()
+    # The file is parsed once; each index gets its own copy of the recipe
+    assert parse_spy.call_count == 1
+    assert first.find_best("alpha") == second.find_best("alpha")
+    assert first.find_best("alpha") is not second.find_best("alpha")
+
+    # Rewriting the file (different size) invalidates the cached parse
+    write_yaml(apps / "a.yaml", {"name": "A", "keywords": ["alpha", "omega"]})
+    third = SimpleKeywordIndex(str(kb_dir))
+    third.index()
+    assert third.find_best("omega")["name"] == "A"
+
+
+def test_simple_keyword_index_indexes_lazily_on_first_query(tmp_path):
+    kb_dir = tmp_path / "kb"
+    apps = kb_dir / "applications"
+    apps.mkdir(parents=True)
+    write_yaml(apps / "a.yaml", {"name": "A", "keywords": ["alpha"]})
+
+    idx = SimpleKeywordIndex(str(kb_dir))
+    assert idx._recipes == []
+    assert idx.find_best("alpha")["name"] == "A"
+
+
+def test_shared_keyword_index_is_reused_per_knowledge_base(tmp_path):
+    kb_dir = tmp_path / "kb"
+    other_dir = tmp_path / "other"
+
+    shared = shared_keyword_index(str(kb_dir))
+    assert shared_keyword_index(str(kb_dir)) is shared
+    assert shared_keyword_index(str(other_dir)) is not shared
+
+
+def test_simple_keyword_index_parses_many_recipes_in_parallel(tmp_path):
+    kb_dir = tmp_path / "kb"
+    apps = kb_dir / "applications"
+    apps.mkdir(parents=True)
+    for i in range(12):
+        write_yaml(apps / f"app{i}.yaml", {"name": f"app{i}", "keywords": [f"kw{i}x"]})
+    (apps / "broken.yaml").write_text("name: [unclosed\n")
+
+    idx = SimpleKeywordIndex(str(kb_dir))
+    idx.index()
+    assert len(idx._recipes) == 12
+    assert idx.find_best("run kw7x please")["name"] == "app7"
+
+
+def test_simple_keyword_index_loads_directory_cache_without_parsing(tmp_path, mocker):
+    kb_dir = tmp_path / "kb"
+    apps = kb_dir / "applications"
+    apps.mkdir(parents=True)
+    write_yaml(apps / "a.yaml", {"name": "A", "keywords": ["alpha"]})
+    write_yaml(apps / "b.yaml", {"name": "B", "keywords": ["beta"]})
+
+    SimpleKeywordIndex(str(kb_dir)).index()
+    assert (apps / INDEX_CACHE_NAME).is_file()
+
+    load_spy = mocker.spy(recipe_index_module, "_load_recipe")
+    idx = SimpleKeywordIndex(str(kb_dir))
+    assert idx.find_best("beta")["name"] == "B"
+    assert load_spy.call_count == 0
+
+    # Adding a recipe changes the fingerprint and forces a re-parse
+    write_yaml(apps / "c.yaml", {"name": "C", "keywords": ["gamma"]})
+    idx = SimpleKeywordIndex(str(kb_dir))
+    assert idx.find_best("gamma")["name"] == "C"
+    assert load_spy.call_count == 3
+
+
+def test_shared_keyword_index_is_rebuilt_when_recipes_change(tmp_path):
+    kb_dir = tmp_path / "kb"
+    apps = kb_dir / "applications"
+    apps.mkdir(parents=True)
+    write_yaml(apps / "a.yaml", {"name": "A", "keywords": ["alpha"]})
+
+    shared = shared_keyword_index(str(kb_dir))
+    assert shared.find_best("beta") is None
+
+    write_yaml(apps / "b.yaml", {"name": "B", "keywords": ["beta"]})
+    refreshed = shared_keyword_index(str(kb_dir))
+    assert refreshed is not shared
+    assert refreshed.find_best("beta")["name"] == "B"
+    assert shared_keyword_index(str(kb_dir)) is refreshed
+
+
+def test_simple_keyword_index_scores_shared_keywords_per_recipe(tmp_path):
+    kb_dir = tmp_path / "kb"
+    apps = kb_dir / "applications"
+    apps.mkdir(parents=True)
+    write_yaml(apps / "a.yaml", {"name": "mpas", "keywords": ["weather", "model"]})
+    write_yaml(apps / "b.yaml", {"name": "wrf", "keywords": ["Weather", "forecast", "model"]})
+
+    idx = SimpleKeywordIndex(str(kb_dir))
+    idx.index()
+    # "weather" and "model" are shared; "forecast" only counts for wrf
+    assert idx.find_best("run the weather forecast model")["name"] == "wrf"
+    assert idx.find_best("forecast")["name"] == "wrf"
+    assert idx.find_best("no overlap") is None
@@ -16,14 +16,55 @@ def test_slurm_get_active_statuses_parses_squeue_output():
 
 def test_slurm_get_final_statuses_parses_sacct_output():
     client = SlurmSchedulerClient()
-    # Simulate sacct output lines; spacing is flexible
+    # Simulate sacct --parsable2 output lines
     fake_stdout = "\n".join([
-        "111      COMPLETED      0:0",
-        "111.batch COMPLETED      0:0",
-        "222      FAILED         1:0",
+        "111|COMPLETED",
+        "111.batch|COMPLETED",
+        "222|FAILED",
+        "444|CANCELLED by 1000",
     ])
     with patch("subprocess.run", return_value=MagicMock(stdout=fake_stdout, stderr="")) as mock_run:
-        statuses = client.get_final_statuses(["111", "222", "333"])  # 333 not present
-    assert statuses == {"111": "COMPLETED", "222": "FAILED"}
+        statuses = client.get_final_statuses(["111", "222", "333", "444"])  # 333 not present
+    assert statuses == {"111": "COMPLETED", "222": "FAILED", "444": "CANCELLED"}
 
 
+def test_slurm_get_final_statuses_matches_whole_job_ids():
+    client = SlurmSchedulerClient()
+    fake_stdout = "\n".join([
+        "1111|FAILED",
+        "111|COMPLETED",
+        "111.batch|CANCELLED",
+    ])
+    with patch("subprocess.run", return_value=MagicMock(stdout=fake_stdout, stderr="")) as mock_run:
+        statuses = client.get_final_statuses(["111"])
+    assert statuses == {"111": "COMPLETED"}
+    assert "--allocations" in mock_run.call_args.args[0]
+    assert "--parsable2" in mock_run.call_args.args[0]
+
+
+def test_slurm_get_final_statuses_maps_array_and_het_job_rows():
+    client = SlurmSchedulerClient()
+    fake_stdout = "\n".join([
+        "1234_1|COMPLETED",
+        "123_4|FAILED",
+        "123_[5-9]|CANCELLED",
+        "456+0|TIMEOUT",
+        "456+1|COMPLETED",
+        "789_2|RUNNING",
+        "789_2.batch|RUNNING",
+    ])
+    with patch("subprocess.run", return_value=MagicMock(stdout=fake_stdout, stderr="")):
+        statuses = client.get_final_statuses(["123", "456", "789_2"])
+    assert statuses == {"123": "FAILED", "456": "TIMEOUT", "789_2": "RUNNING"}
+
+
+def test_slurm_state_maps_translate_backend_states():
+    class MappedClient(SlurmSchedulerClient):
+        ACTIVE_STATE_MAP = {"COMPLETING": "RUNNING"}
+        FINAL_STATE_MAP = {"OUT_OF_MEMORY": "FAILED"}
+
+    client = MappedClient()
+    with patch("subprocess.run", return_value=MagicMock(stdout="111,completing\n222,PENDING", stderr="")):
+        assert client.get_active_statuses(["111", "222"]) == {"111": "RUNNING", "222": "PENDING"}
+    with patch("subprocess.run", return_value=MagicMock(stdout="111|OUT_OF_MEMORY", stderr="")):
+        assert client.get_final_statuses(["111"]) == {"111": "FAILED"}
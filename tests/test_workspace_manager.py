@@ -1,7 +1,6 @@
 import pytest
 from pathlib import Path
 from unittest.mock import patch
-import uuid
 from datetime import datetime
 from freezegun import freeze_time
 
@@ -15,13 +14,12 @@ def test_workspace_manager_initialization(tmp_path):
     assert manager.base_path == tmp_path
 
 @freeze_time("2025-08-14 12:30:00")
-@patch("uuid.uuid4")
-def test_create_job_workspace_creates_directories(mock_uuid, tmp_path):
+@patch("jobsherpa.agent.workspace_manager.secrets.token_hex", return_value="123456")
+def test_create_job_workspace_creates_directories(mock_token_hex, tmp_path):
     """
     Tests that the create_job_workspace method physically creates the
     job directory and its internal structure using the new naming convention.
     """
-    mock_uuid.return_value = uuid.UUID('12345678-1234-5678-1234-567812345678')
     manager = WorkspaceManager(base_path=str(tmp_path))
 
     workspace = manager.create_job_workspace()
@@ -34,13 +32,12 @@ def test_create_job_workspace_creates_directories(mock_uuid, tmp_path):
     assert (expected_job_dir / "slurm").is_dir()
 
 @freeze_time("2025-08-14 12:30:00")
-@patch("uuid.uuid4")
-def test_create_job_workspace_returns_correct_paths(mock_uuid, tmp_path):
+@patch("jobsherpa.agent.workspace_manager.secrets.token_hex", return_value="123456")
+def test_create_job_workspace_returns_correct_paths(mock_token_hex, tmp_path):
     """
     Tests that the create_job_workspace method returns a JobWorkspace
     object with the correct, fully-resolved paths using the new naming convention.
     """
-    mock_uuid.return_value = uuid.UUID('12345678-1234-5678-1234-567812345678')
     manager = WorkspaceManager(base_path=str(tmp_path))
 
     workspace = manager.create_job_workspace()
@@ -53,3 +50,18 @@ def test_create_job_workspace_returns_correct_paths(mock_uuid, tmp_path):
     assert workspace.output_dir == expected_job_dir / "output"
     assert workspace.slurm_dir == expected_job_dir / "slurm"
     assert workspace.script_path == expected_job_dir / "job_script.sh"
+
+def test_create_job_workspace_uses_unique_suffixes(tmp_path):
+    """
+    Tests that two workspaces created in the same minute get distinct
+    six-character hex suffixes.
+    """
+    manager = WorkspaceManager(base_path=str(tmp_path))
+    with freeze_time("2025-08-14 12:30:00"):
+        first = manager.create_job_workspace()
+        second = manager.create_job_workspace()
+
+    assert first.job_dir != second.job_dir
+    suffix = first.job_dir.name.rsplit("-", 1)[1]
+    assert len(suffix) == 6
+    int(suffix, 16)